@@ -51,7 +51,7 @@ def fetch_movie_list(sheet_name):
 
 # ---------------- MOVIE / IMAGE RANDOMIZER ---------------- #
 def pick_random_movies(movies, count):
-    return random.SystemRandom().sample(movies, k=count)
+    return random.sample(movies, k=count)
 
 def load_random_image(directory, prefix, max_num):
     path = directory / f"{prefix}_{random.randint(1, max_num)}.png"
@@ -1,4 +1,5 @@
 # Refactored and Cleaned Up Movie Picker App with YouTube API Fallback and Displaying YouTube Video Titles
+import atexit
 import os
 import re
 import json
@@ -59,9 +60,11 @@ def fuzzy_search(target: str, candidates: List[str]) -> Optional[str]:
     matches = get_close_matches(target, candidates, n=1, cutoff=0.6)
     return matches[0] if matches else None
 
+_LOG_FH = open(LOG_FILE, "a", encoding="utf-8", buffering=1)  # line-buffered, opened once
+atexit.register(_LOG_FH.close)
+
 def log_debug(message: str) -> None:
-    with open(LOG_FILE, "a", encoding="utf-8") as log_file:
-        log_file.write(f"{message}\n")
+    _LOG_FH.write(f"{message}\n")
 
 def youtube_api_search(query: str) -> Optional[tuple]:
     params = {
@@ -97,16 +100,22 @@ def fetch_movie_list(sheet_name: str) -> List[str]:
 
 # ---------------- MOVIE / IMAGE RANDOMIZER ---------------- #
 def pick_random_movies(movies: List[str], count: int) -> List[str]:
-    return random.SystemRandom().sample(movies, k=count)
+    return random.sample(movies, k=count)
+
+_PHOTO_CACHE = {}  # Path -> ImageTk.PhotoImage, decoded once per session
+
+def _load_photo(path: Path):
+    img = _PHOTO_CACHE.get(path)
+    if img is None and path.exists():
+        img = _PHOTO_CACHE[path] = ImageTk.PhotoImage(Image.open(path))
+    return img
 
 def load_random_image(directory: Path, prefix: str, max_num: int):
-    path = directory / f"{prefix}_{random.randint(1, max_num)}.png"
-    return ImageTk.PhotoImage(Image.open(path)) if path.exists() else None
+    return _load_photo(directory / f"{prefix}_{random.randint(1, max_num)}.png")
 
 def load_direction_image():
     direction = random.choice(["clockwise", "counter_clockwise"])
-    path = NUMBERS_DIR / f"{direction}.png"
-    return ImageTk.PhotoImage(Image.open(path)) if path.exists() else None
+    return _load_photo(NUMBERS_DIR / f"{direction}.png")
 
 # ---------------- TRAILER HANDLING ---------------- #
 def get_stable_youtube_url(youtube_url: str) -> str:
@@ -201,10 +210,10 @@ def on_start(event=None):
     col_frame2 = tk.Frame(middle_frame, bg=BACKGROUND_COLOR)
     col_frame2.grid(row=0, column=1, sticky="nw", padx=20)
 
-    current_column = col_frame1
-    lines_in_column = 0
-    max_lines_per_column = 20
-
+    # Labels are parented to middle_frame and packed *into* the column
+    # frames, so overflow rows can be moved to col_frame2 after a single
+    # layout pass instead of flushing Tk's idle queue for every movie.
+    labels = []
     for movie in selected_movies:
         trailer, source, yt_video_title = locate_trailer(sheet, movie)
         display_text = movie
@@ -215,19 +224,21 @@ def on_start(event=None):
             display_text += f" (YT: {yt_video_title})"
 
         if trailer:
-            label = tk.Label(current_column, text=display_text, fg=color, cursor="hand2", wraplength=280, justify="left", bg=BACKGROUND_COLOR)
-            label.pack(anchor="w", pady=2)
+            label = tk.Label(middle_frame, text=display_text, fg=color, cursor="hand2", wraplength=280, justify="left", bg=BACKGROUND_COLOR)
             playlist_items.append((movie, trailer))
             label.bind("<Button-1>", lambda e, url=trailer: webbrowser.open(url))
         else:
-            label = tk.Label(current_column, text=f"{movie}: No trailer found", fg=ERROR_COLOR, wraplength=280, justify="left", bg=BACKGROUND_COLOR)
-            label.pack(anchor="w", pady=2)
+            label = tk.Label(middle_frame, text=f"{movie}: No trailer found", fg=ERROR_COLOR, wraplength=280, justify="left", bg=BACKGROUND_COLOR)
+        label.pack(in_=col_frame1, anchor="w", pady=2)
+        labels.append(label)
 
+    if labels:
         root.update_idletasks()
-        lines_in_column += 1
-        if lines_in_column * (label.winfo_reqheight() + 4) >= middle_canvas.winfo_height() - 5 and current_column == col_frame1:
-            current_column = col_frame2
-            lines_in_column = 0
+        row_height = labels[0].winfo_reqheight() + 4
+        rows_per_column = max(1, -(-(middle_canvas.winfo_height() - 5) // row_height))
+        for label in labels[rows_per_column:]:
+            label.pack_forget()
+            label.pack(in_=col_frame2, anchor="w", pady=2)
 
     if playlist_items:
         playlist_path = PLAYLIST_DIR / f"{datetime.date.today()}_Movie_Night.m3u"
@@ -1,29 +1,72 @@
 import os
 import re
+import string
+import functools
 import io
+import zipfile
+import xml.etree.ElementTree as ET
 import json
+import asyncio
+import logging
 import random
+import sqlite3
 import subprocess
 import sys
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import messagebox
+import tkinter.font as tkfont
 from pathlib import Path
 from dotenv import load_dotenv
 from google.oauth2.service_account import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 import pickle
+import queue
 from PIL import Image, ImageTk
 import datetime
 from typing import Optional, List
 import requests
+from requests.adapters import HTTPAdapter
 import openpyxl
 
+try:
+    # Optional Rust JSON parser; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional: persist pre-normalized trailer maps next to the JSON files
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    # Optional: concurrent YouTube fallback searches; serial requests otherwise
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    # Optional Rust-backed xlsx reader; openpyxl is the fallback
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
 # Additional import to download file from Drive
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
 from difflib import get_close_matches
 
+try:
+    # Optional C++ fuzzy matcher; difflib is the fallback
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:
+    fuzz_process = None
+
 # --------------------- CONFIGURATION --------------------- #
 BASE_DIR = Path(__file__).resolve().parent
 ENV_PATH = BASE_DIR / "secret.env"
@@ -48,6 +91,11 @@ YOUTUBE_SCOPES = ["https://www.googleapis.com/auth/youtube"]
 # For searching YouTube
 YOUTUBE_SEARCH_URL = "https://www.googleapis.com/youtube/v3/search"
 
+# On-disk cache of YouTube search results (query -> url, title)
+YT_CACHE_FILE = BASE_DIR / "yt_cache.sqlite"
+YT_CACHE_TTL = 7 * 24 * 3600  # seconds
+YT_MISS_TTL = 24 * 3600  # seconds; "no results" answers expire sooner
+
 # -------------DARK MODE THEME COLORS --------------------- #
 BACKGROUND_COLOR = "#2e2e2e"
 FOREGROUND_COLOR = "#e0e0e0"
@@ -68,20 +116,40 @@ if not YOUTUBE_API_KEY:
     raise EnvironmentError("Missing YOUTUBE_API_KEY in secret.env")
 
 # ---------------- UTILS ---------------- #
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*-]')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_VIDEO_ID_RE = re.compile(r'youtube\.com/watch\?v=([^&]+)')
+# ASCII delete-table for normalize(): drops everything but [a-z0-9]
+_KEEP_CHARS = set(string.ascii_lowercase + string.digits)
+_NORMALIZE_TABLE = {c: None for c in range(128) if chr(c) not in _KEEP_CHARS}
+
+
+# One handler keeps LOG_FILE open for the session instead of open()/close() per line
+_log_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
+_log_handler.setFormatter(logging.Formatter("%(message)s"))
+_log = logging.getLogger("RNGMovie")
+_log.addHandler(_log_handler)
+_log.setLevel(logging.DEBUG)
+_log.propagate = False
+
+
 def log_debug(message: str) -> None:
     """Log debug messages to a file for troubleshooting (cross-platform)."""
-    with open(LOG_FILE, "a", encoding="utf-8") as log_file:
-        log_file.write(f"{message}\n")
+    _log.debug(message)
 
 
 def sanitize_filename(name: str) -> str:
     """Remove characters invalid for filenames; strip leading/trailing spaces."""
-    return re.sub(r'[<>:"/\\|?*-]', '', name.strip())
+    return _SANITIZE_RE.sub('', name.strip())
 
 
 def normalize(text: str) -> str:
     """Lowercase the string and remove all non-alphanumeric characters."""
-    return re.sub(r'[^a-z0-9]', '', text.strip().lower())
+    text = text.lower()
+    if text.isascii():
+        return text.translate(_NORMALIZE_TABLE)
+    return _NON_ALNUM_RE.sub('', text)
 
 
 def fuzzy_search(target: str, candidates: List[str], cutoff=0.8) -> Optional[str]:
@@ -89,20 +157,35 @@ def fuzzy_search(target: str, candidates: List[str], cutoff=0.8) -> Optional[str
     Return the best fuzzy match for 'target' within 'candidates'.
     By default, cutoff=0.8 for an 80% match requirement.
     """
+    if fuzz_process is not None:
+        best = fuzz_process.extractOne(target, candidates, scorer=fuzz.ratio, score_cutoff=cutoff * 100)
+        return best[0] if best else None
     matches = get_close_matches(target, candidates, n=1, cutoff=cutoff)
     return matches[0] if matches else None
 
+def parse_json_bytes(raw: bytes):
+    """Parse JSON from raw bytes (orjson if available)."""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def read_json_file(path: Path):
+    """Parse a JSON file straight from bytes (orjson if available)."""
+    return parse_json_bytes(path.read_bytes())
+
 def open_in_windows_default(url: str):
     subprocess.run(["wslview", url])
 
 
 # ---------------- YOUTUBE TRAILER SEARCH ---------------- #
-def youtube_api_search(query: str) -> Optional[tuple]:
-    """
-    Use the public YouTube Search API to find a single short video by 'query'.
-    Return (video_url, video_title) if successful, else None.
-    """
-    params = {
+YT_MAX_CONCURRENT = 8  # cap on parallel fallback searches (quota bursts)
+
+# One pooled keep-alive session so repeated searches reuse the TLS connection
+_YT_SESSION = requests.Session()
+_YT_SESSION.headers["Accept-Encoding"] = "gzip"
+_YT_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+
+def _yt_search_params(query: str) -> dict:
+    return {
         "part": "snippet",
         "q": query,
         "key": YOUTUBE_API_KEY,
@@ -110,18 +193,107 @@ def youtube_api_search(query: str) -> Optional[tuple]:
         "maxResults": 1,
         "type": "video"
     }
+
+
+def _parse_yt_search(data: dict) -> Optional[tuple]:
+    """Pull (video_url, video_title) out of a search response, or None."""
+    if "items" in data and data["items"]:
+        video_id = data["items"][0]["id"]["videoId"]
+        video_title = data["items"][0]["snippet"]["title"]
+        return f"https://www.youtube.com/watch?v={video_id}", video_title
+    return None
+
+
+_YT_CACHE = sqlite3.connect(YT_CACHE_FILE, check_same_thread=False)
+_YT_CACHE.execute("CREATE TABLE IF NOT EXISTS yt (q TEXT PRIMARY KEY, url TEXT, title TEXT, ts INTEGER)")
+_YT_CACHE_LOCK = threading.Lock()
+
+
+def _yt_cache_get(query: str) -> Optional[tuple]:
+    """
+    Return the cached (video_url, video_title) for 'query', or None if nothing fresh is cached.
+    A remembered "no results" answer comes back as (None, None).
+    """
+    now = int(time.time())
+    with _YT_CACHE_LOCK:
+        row = _YT_CACHE.execute(
+            "SELECT url, title FROM yt WHERE q = ? "
+            "AND ts > CASE WHEN url IS NULL THEN ? ELSE ? END",
+            (query, now - YT_MISS_TTL, now - YT_CACHE_TTL)
+        ).fetchone()
+    return tuple(row) if row else None
+
+
+def _yt_cache_put(query: str, result: Optional[tuple]) -> None:
+    """Store a hit, or a miss (result=None) for a search that succeeded but found nothing."""
+    url, title = result or (None, None)
+    with _YT_CACHE_LOCK:
+        _YT_CACHE.execute(
+            "INSERT OR REPLACE INTO yt (q, url, title, ts) VALUES (?, ?, ?, ?)",
+            (query, url, title, int(time.time()))
+        )
+        _YT_CACHE.commit()
+
+
+def youtube_api_search(query: str) -> Optional[tuple]:
+    """
+    Use the public YouTube Search API to find a single short video by 'query'.
+    Return (video_url, video_title) if successful, else None.
+    Hits are cached on disk for YT_CACHE_TTL seconds, empty answers for YT_MISS_TTL.
+    """
+    cached = _yt_cache_get(query)
+    if cached is not None:
+        return cached if cached[0] else None
     try:
-        response = requests.get(YOUTUBE_SEARCH_URL, params=params)
-        data = response.json()
-        if "items" in data and data["items"]:
-            video_id = data["items"][0]["id"]["videoId"]
-            video_title = data["items"][0]["snippet"]["title"]
-            return f"https://www.youtube.com/watch?v={video_id}", video_title
+        response = _YT_SESSION.get(YOUTUBE_SEARCH_URL, params=_yt_search_params(query), timeout=10)
+        result = _parse_yt_search(parse_json_bytes(response.content))
+        if response.ok:  # never cache quota/auth errors
+            _yt_cache_put(query, result)
+        return result
     except Exception as e:
         log_debug(f"[ERROR] YouTube API search failed: {e}")
     return None
 
 
+async def _yt_search_async(session, sem: asyncio.Semaphore, query: str) -> Optional[tuple]:
+    async with sem:
+        try:
+            async with session.get(YOUTUBE_SEARCH_URL, params=_yt_search_params(query)) as resp:
+                result = _parse_yt_search(parse_json_bytes(await resp.read()))
+                if resp.ok:
+                    _yt_cache_put(query, result)
+                return result
+        except Exception as e:
+            log_debug(f"[ERROR] YouTube API search failed: {e}")
+    return None
+
+
+async def _gather_yt_searches(queries: List[str]) -> List[Optional[tuple]]:
+    sem = asyncio.Semaphore(YT_MAX_CONCURRENT)
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        return await asyncio.gather(*(_yt_search_async(session, sem, q) for q in queries))
+
+
+def youtube_api_search_many(queries: List[str]) -> List[Optional[tuple]]:
+    """
+    Run several YouTube searches, concurrently when aiohttp is installed.
+    Results come back in the same order as 'queries'.
+    """
+    results = [_yt_cache_get(q) for q in queries]
+    misses = [i for i, r in enumerate(results) if r is None]
+    results = [r if r and r[0] else None for r in results]
+    if aiohttp is None or len(misses) < 2:
+        for i in misses:
+            results[i] = youtube_api_search(queries[i])
+        return results
+
+    fetched = asyncio.run(_gather_yt_searches([queries[i] for i in misses]))
+    for i, result in zip(misses, fetched):
+        results[i] = result
+    return results
+
+
 # ---------------- DRIVE (DOWNLOAD SHEET AS XLSX) ---------------- #
 def get_drive_service():
     """
@@ -159,29 +331,145 @@ def download_spreadsheet_as_xlsx(spreadsheet_id: str, out_file: Path):
 
 
 # ---------------- XLSX PROCESSING (READ LOCAL FILE) ---------------- #
+_WORKBOOKS = {}                 # path -> (mtime, workbook)
+_WORKBOOKS_LOCK = threading.RLock()
+_COLUMN_A = {}                  # (path, mtime, sheet) -> column A titles
+_COLUMN_A_MAX = 32
+
+
+def load_workbook_cached(xlsx_file: Path):
+    """
+    Open 'xlsx_file' once per mtime and reuse it: CalamineWorkbook if
+    installed, else openpyxl read-only. Returns (mtime, workbook). When the
+    file is re-downloaded the previous workbook is closed (read-only
+    openpyxl keeps the zip open), so callers read it while holding
+    _WORKBOOKS_LOCK.
+    """
+    mtime = xlsx_file.stat().st_mtime
+    with _WORKBOOKS_LOCK:
+        cached = _WORKBOOKS.get(xlsx_file)
+        if cached is not None:
+            if cached[0] == mtime:
+                return cached
+            del _WORKBOOKS[xlsx_file]
+            if hasattr(cached[1], "close"):
+                cached[1].close()
+        if CalamineWorkbook is not None:
+            wb = CalamineWorkbook.from_path(str(xlsx_file))
+        else:
+            wb = openpyxl.load_workbook(xlsx_file, read_only=True, data_only=True, keep_links=False)
+        _WORKBOOKS[xlsx_file] = (mtime, wb)
+        return mtime, wb
+
+
+def close_workbook_cached(xlsx_file: Path):
+    """
+    Close and forget the cached workbook for 'xlsx_file' along with its
+    column A entries. Call before overwriting the file: read-only openpyxl
+    keeps the zip open, which blocks the write on Windows.
+    """
+    with _WORKBOOKS_LOCK:
+        cached = _WORKBOOKS.pop(xlsx_file, None)
+        if cached is not None and hasattr(cached[1], "close"):
+            cached[1].close()
+        for key in [k for k in _COLUMN_A if k[0] == xlsx_file]:
+            del _COLUMN_A[key]
+
+
+_XLSX_NS = {"m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+
 def get_all_sheet_names_local(xlsx_file: Path) -> List[str]:
-    """Return a list of all sheet names from the local .xlsx file (cross-platform)."""
-    wb = openpyxl.load_workbook(xlsx_file, read_only=True)
-    return wb.sheetnames
+    """
+    Return a list of all sheet names from the local .xlsx file (cross-platform).
+    Only xl/workbook.xml is read from the zip; no sheet data is parsed.
+    """
+    with zipfile.ZipFile(xlsx_file) as zf, zf.open("xl/workbook.xml") as f:
+        wb_root = ET.parse(f).getroot()
+    return [s.get("name") for s in wb_root.findall(".//m:sheet", _XLSX_NS)]
+
+
+def _cell_text(val) -> str:
+    """Cell value -> stripped string ('1917.0' from a numeric cell becomes '1917')."""
+    if isinstance(val, float) and val.is_integer():
+        val = int(val)
+    return val.strip() if isinstance(val, str) else str(val).strip()
+
+
+def _workbook_sheet_names(wb) -> List[str]:
+    return wb.sheet_names if CalamineWorkbook is not None else wb.sheetnames
+
+
+def _read_column_a(wb, sheet_name: str) -> List[str]:
+    """Return the stripped, non-empty values of column A in 'sheet_name'."""
+    if CalamineWorkbook is not None:
+        rows = wb.get_sheet_by_name(sheet_name).to_python()
+    else:
+        rows = wb[sheet_name].iter_rows(min_row=1, max_col=1, values_only=True)
+    movies = []
+    for row in rows:
+        if row and row[0] is not None and (text := _cell_text(row[0])):
+            movies.append(text)
+    return movies
+
+
+def _column_a_cached(xlsx_file: Path, mtime: float, wb, sheet_name: str) -> tuple:
+    """Column A of 'sheet_name' in 'wb' (the 'mtime' version), read once."""
+    key = (xlsx_file, mtime, sheet_name)
+    titles = _COLUMN_A.get(key)
+    if titles is None:
+        titles = tuple(_read_column_a(wb, sheet_name))
+        if len(_COLUMN_A) >= _COLUMN_A_MAX:
+            _COLUMN_A.pop(next(iter(_COLUMN_A)))     # drop the oldest
+        _COLUMN_A[key] = titles
+    return titles
 
 
 def fetch_movie_list_local(xlsx_file: Path, sheet_name: str) -> List[str]:
     """
     Read the first column (A) from 'sheet_name' in the local Excel file.
     Return a list of stripped movie names (non-empty).
+    Uses python-calamine when installed, otherwise openpyxl read-only.
     """
-    wb = openpyxl.load_workbook(xlsx_file, read_only=True)
-    if sheet_name not in wb.sheetnames:
-        log_debug(f"[ERROR] Sheet '{sheet_name}' not found in {xlsx_file.name}.")
-        return []
+    with _WORKBOOKS_LOCK:
+        _, wb = load_workbook_cached(xlsx_file)
+        if sheet_name not in _workbook_sheet_names(wb):
+            log_debug(f"[ERROR] Sheet '{sheet_name}' not found in {xlsx_file.name}.")
+            return []
+        return _read_column_a(wb, sheet_name)
 
-    sheet = wb[sheet_name]
-    movies = []
-    for row in sheet.iter_rows(min_row=1, max_col=1, values_only=True):
-        val = row[0]
-        if val and str(val).strip():
-            movies.append(str(val).strip())
-    return movies
+
+def match_sheet_name(user_input: str, sheet_names: List[str]) -> Optional[str]:
+    """
+    Map the user's sheet name onto an actual one: exact match ignoring case and
+    whitespace first, then fuzzy search (80% cutoff). None if nothing matches.
+    """
+    # Create a map { normalized_name -> actual_sheet_name }
+    # e.g. "mysheet" -> "My Sheet"
+    sheet_map = {_WHITESPACE_RE.sub("", s.lower()): s for s in sheet_names}
+
+    # 1) Try direct normal comparison
+    user_normal = _WHITESPACE_RE.sub("", user_input.lower())
+    if user_normal in sheet_map:
+        return sheet_map[user_normal]
+
+    # 2) If not found, do fuzzy search on the keys
+    best_key = fuzzy_search(user_normal, list(sheet_map.keys()), cutoff=0.8)
+    return sheet_map[best_key] if best_key else None
+
+
+def load_sheet_movies(xlsx_file: Path, user_sheet_input: str):
+    """
+    Open the workbook once, resolve 'user_sheet_input' to a sheet and read its
+    column A. Return (chosen_sheet, movies), or (None, []) if no sheet matched.
+    """
+    with _WORKBOOKS_LOCK:
+        mtime, wb = load_workbook_cached(xlsx_file)
+        chosen_sheet = match_sheet_name(user_sheet_input, _workbook_sheet_names(wb))
+        if not chosen_sheet:
+            return None, []
+        # repeated Starts on an unchanged file cost one stat() instead of a re-read
+        return chosen_sheet, list(_column_a_cached(xlsx_file, mtime, wb, chosen_sheet))
 
 
 # ---------------- JSON CREATION & POPULATION ---------------- #
@@ -209,7 +497,7 @@ def populate_json_with_movies(sheet_name: str, movies: List[str]):
     json_file = ensure_url_json_exists(sheet_name)
 
     try:
-        existing_data = json.loads(json_file.read_text(encoding="utf-8"))
+        existing_data = read_json_file(json_file)
     except json.JSONDecodeError:
         existing_data = {}
 
@@ -230,33 +518,70 @@ def populate_json_with_movies(sheet_name: str, movies: List[str]):
 
 
 # ---------------- LOCATE TRAILER (READ JSON OR SEARCH YT) ---------------- #
-def locate_trailer(sheet_name: str, movie_title: str) -> (Optional[str], str, Optional[str]):
+def trailer_search_query(movie_title: str) -> str:
+    return movie_title + " official hd trailer"
+
+
+@functools.lru_cache(maxsize=16)
+def _load_trailer_map(urls_file: Path, mtime: float):
     """
-    Look up a trailer URL in <sheetName>Urls.json, or fallback to YouTube search.
-    Return (url, source, video_title).
+    Parse 'urls_file' once per (path, mtime).
+    Return ({normalized_title: url}, [normalized_titles]) for lookups + fuzzy search.
+    With msgpack installed the normalized map is also kept in a
+    <name>.norm.msgpack sidecar, reused until the JSON is newer.
     """
+    sidecar = urls_file.with_suffix(".norm.msgpack")
+    if msgpack is not None and sidecar.exists() and sidecar.stat().st_mtime >= mtime:
+        try:
+            normalized_dict = msgpack.unpackb(sidecar.read_bytes(), raw=False)
+            return normalized_dict, list(normalized_dict.keys())
+        except Exception as e:
+            log_debug(f"[ERROR] Bad trailer sidecar {sidecar.name}: {e}")
+
+    url_dict = read_json_file(urls_file)
+    normalized_dict = {normalize(k): v for k, v in url_dict.items()}
+    if msgpack is not None:
+        try:
+            sidecar.write_bytes(msgpack.packb(normalized_dict, use_bin_type=True))
+        except OSError as e:
+            log_debug(f"[ERROR] Could not write {sidecar.name}: {e}")
+    return normalized_dict, list(normalized_dict.keys())
+
+
+def lookup_trailer_json(sheet_name: str, movie_title: str) -> Optional[str]:
+    """Return the trailer URL stored in <sheetName>Urls.json, or None."""
     safe_sheet = sanitize_filename(sheet_name).replace(" ", "")
     urls_file = TRAILERS_DIR / f"{safe_sheet}Urls.json"
 
-    # 1. Check local JSON file
     if urls_file.exists():
         try:
-            url_dict = json.loads(urls_file.read_text(encoding="utf-8"))
-            normalized_dict = {normalize(k): v for k, v in url_dict.items()}
+            normalized_dict, keys = _load_trailer_map(urls_file, urls_file.stat().st_mtime)
             key = normalize(movie_title)
-            matched_url = (
-                normalized_dict.get(key)
-                or normalized_dict.get(fuzzy_search(key, list(normalized_dict.keys())) or '')
-            )
-            if matched_url and "youtube.com" in matched_url:
-                return matched_url, "json", None
-            elif matched_url:
-                return matched_url, "json", None
+            matched_url = normalized_dict.get(key)
+            if matched_url is None:
+                # only fuzzy-match when the title isn't in the sheet at all;
+                # a present-but-empty entry would fuzzy-match itself anyway
+                match = fuzzy_search(key, keys)
+                matched_url = normalized_dict.get(match) if match else None
+            if matched_url:
+                return matched_url
         except json.JSONDecodeError as e:
             log_debug(f"[ERROR] JSON decoding failed: {e}")
+    return None
+
+
+def locate_trailer(sheet_name: str, movie_title: str) -> (Optional[str], str, Optional[str]):
+    """
+    Look up a trailer URL in <sheetName>Urls.json, or fallback to YouTube search.
+    Return (url, source, video_title).
+    """
+    # 1. Check local JSON file
+    matched_url = lookup_trailer_json(sheet_name, movie_title)
+    if matched_url:
+        return matched_url, "json", None
 
     # 2. Fallback: YouTube search API
-    api_result = youtube_api_search(movie_title + " official hd trailer")
+    api_result = youtube_api_search(trailer_search_query(movie_title))
     if api_result:
         api_url, yt_video_title = api_result
         return api_url, "youtube", yt_video_title
@@ -266,24 +591,39 @@ def locate_trailer(sheet_name: str, movie_title: str) -> (Optional[str], str, Op
 
 
 # ---------------- YOUTUBE PLAYLIST CREATION ---------------- #
+_YT_SERVICE = None
+_YT_CREDS = None
+_YT_SERVICE_LOCK = threading.Lock()
+
+
 def get_youtube_service():
     """
     Create and return an authorized YouTube Data API client using OAuth (for user-level actions).
     Stores and reuses credentials in 'youtube_token.pickle'.
+    The client is built once and reused while its credentials stay valid.
     """
-    creds = None
-    if YOUTUBE_TOKEN_FILE.exists():
-        with open(YOUTUBE_TOKEN_FILE, "rb") as token:
-            creds = pickle.load(token)
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file(str(CLIENT_SECRET_FILE), YOUTUBE_SCOPES)
-            creds = flow.run_local_server(port=0)
-        with open(YOUTUBE_TOKEN_FILE, "wb") as token:
-            pickle.dump(creds, token)
-    return build("youtube", "v3", credentials=creds)
+    global _YT_SERVICE, _YT_CREDS
+    with _YT_SERVICE_LOCK:
+        if _YT_SERVICE is not None and _YT_CREDS is not None and _YT_CREDS.valid:
+            return _YT_SERVICE
+
+        creds = _YT_CREDS
+        if creds is None and YOUTUBE_TOKEN_FILE.exists():
+            with open(YOUTUBE_TOKEN_FILE, "rb") as token:
+                creds = pickle.load(token)
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+            else:
+                flow = InstalledAppFlow.from_client_secrets_file(str(CLIENT_SECRET_FILE), YOUTUBE_SCOPES)
+                creds = flow.run_local_server(port=0)
+            with open(YOUTUBE_TOKEN_FILE, "wb") as token:
+                pickle.dump(creds, token)
+
+        _YT_CREDS = creds
+        # static_discovery: use the discovery doc bundled with the client library
+        _YT_SERVICE = build("youtube", "v3", credentials=creds, static_discovery=True)
+        return _YT_SERVICE
 
 
 def create_youtube_playlist(title: str, video_ids: List[str]) -> Optional[str]:
@@ -305,8 +645,15 @@ def create_youtube_playlist(title: str, video_ids: List[str]) -> Optional[str]:
         ).execute()
 
         playlist_id = playlist["id"]
+
+        def on_item_added(request_id, response, exception):
+            if exception is not None:
+                log_debug(f"[ERROR] Adding video #{request_id} to playlist failed: {exception}")
+
+        # All inserts go out as one multipart batch request instead of N round trips
+        batch = youtube.new_batch_http_request(callback=on_item_added)
         for vid in video_ids:
-            youtube.playlistItems().insert(
+            batch.add(youtube.playlistItems().insert(
                 part="snippet",
                 body={
                     "snippet": {
@@ -317,7 +664,8 @@ def create_youtube_playlist(title: str, video_ids: List[str]) -> Optional[str]:
                         }
                     }
                 },
-            ).execute()
+            ))
+        batch.execute()
 
         return f"https://www.youtube.com/playlist?list={playlist_id}"
     except Exception as e:
@@ -328,7 +676,37 @@ def create_youtube_playlist(title: str, video_ids: List[str]) -> Optional[str]:
 # ---------------- IMAGE HANDLING ---------------- #
 def pick_random_movies(movies: List[str], count: int) -> List[str]:
     """Randomly sample 'count' distinct movies from the 'movies' list."""
-    return random.SystemRandom().sample(movies, k=count)
+    return random.sample(movies, k=count)
+
+
+# PNG decode happens on a worker thread; the Tk PhotoImage itself must be
+# created on the main thread, then it's cached for later Start clicks.
+_IMG_POOL = ThreadPoolExecutor(max_workers=2)
+_DECODED = {}    # Path -> Future[PIL.Image]
+_IMG_CACHE = {}  # Path -> ImageTk.PhotoImage
+
+
+def _decode_png(path: Path):
+    img = Image.open(path)
+    img.load()
+    return img
+
+
+def prefetch_images(directory: Path) -> None:
+    """Start decoding every PNG in 'directory' in the background."""
+    for path in directory.glob("*.png"):
+        if path not in _DECODED:
+            _DECODED[path] = _IMG_POOL.submit(_decode_png, path)
+
+
+def _load_photo(path: Path):
+    """Return a cached PhotoImage for 'path', or None if the file is missing."""
+    img = _IMG_CACHE.get(path)
+    if img is None and path.exists():
+        future = _DECODED.get(path)
+        pil_img = future.result() if future else _decode_png(path)
+        img = _IMG_CACHE[path] = ImageTk.PhotoImage(pil_img)
+    return img
 
 
 def load_random_image(directory: Path, prefix: str, max_num: int):
@@ -336,10 +714,7 @@ def load_random_image(directory: Path, prefix: str, max_num: int):
     Load a random image from 'directory' with a file name like 'prefix_1.png'
     up to 'prefix_{max_num}.png'. Return a PhotoImage or None if missing.
     """
-    path = directory / f"{prefix}_{random.randint(1, max_num)}.png"
-    if path.exists():
-        return ImageTk.PhotoImage(Image.open(path))
-    return None
+    return _load_photo(directory / f"{prefix}_{random.randint(1, max_num)}.png")
 
 
 def load_direction_image():
@@ -347,10 +722,7 @@ def load_direction_image():
     Load a random direction image (clockwise or counter_clockwise) from NUMBERS_DIR.
     """
     direction = random.choice(["clockwise", "counter_clockwise"])
-    path = NUMBERS_DIR / f"{direction}.png"
-    if path.exists():
-        return ImageTk.PhotoImage(Image.open(path))
-    return None
+    return _load_photo(NUMBERS_DIR / f"{direction}.png")
 
 
 # ---------------- GUI SETUP ---------------- #
@@ -373,26 +745,50 @@ def on_mousewheel(event):
 
 
 # ---------------- BUTTON LOGIC ---------------- #
-def on_update_sheets():
+def update_sheets():
     """
     1) Download the Google Sheet as 'ghib.xlsx'
     2) For each sheet in that file, read col A and write movie placeholders to JSON.
+    Return the number of sheets processed.
     """
-    try:
-        # Download the .xlsx
+    # Download the .xlsx; hold the lock so no Start reopens the old file mid-write
+    with _WORKBOOKS_LOCK:
+        close_workbook_cached(GHIB_FILE)
         download_spreadsheet_as_xlsx(SPREADSHEET_ID, GHIB_FILE)
 
-        # For each sheet in the local XLSX, parse col A -> populate JSON
-        sheet_names = get_all_sheet_names_local(GHIB_FILE)
-        for sheet in sheet_names:
-            movies = fetch_movie_list_local(GHIB_FILE, sheet)
-            populate_json_with_movies(sheet, movies)
+    # For each sheet in the local XLSX, parse col A -> populate JSON
+    sheet_names = get_all_sheet_names_local(GHIB_FILE)
+    for sheet in sheet_names:
+        movies = fetch_movie_list_local(GHIB_FILE, sheet)
+        populate_json_with_movies(sheet, movies)
+    return len(sheet_names)
 
-        messagebox.showinfo("Sheets Updated", f"Updated from Google Sheets!\nProcessed {len(sheet_names)} sheet(s).")
-    except Exception as e:
-        log_debug(f"[ERROR updating sheets]: {e}")
+
+def on_update_sheets():
+    """
+    Run update_sheets() in-process on a background thread so the Tk loop
+    stays responsive; the result is handed back to the Tk thread via root.after.
+    """
+    def finished(count):
+        update_button.config(state="normal")
+        messagebox.showinfo("Sheets Updated", f"Updated from Google Sheets!\nProcessed {count} sheet(s).")
+
+    def failed():
+        update_button.config(state="normal")
         messagebox.showerror("Error", "Failed to update from Google Sheets. Check logs.")
 
+    def work():
+        try:
+            count = update_sheets()
+        except Exception as e:
+            log_debug(f"[ERROR updating sheets]: {e}")
+            root.after(0, failed)
+        else:
+            root.after(0, finished, count)
+
+    update_button.config(state="disabled")
+    threading.Thread(target=work, daemon=True).start()
+
 
 def on_start(event=None):
     """
@@ -401,6 +797,10 @@ def on_start(event=None):
       - Fuzzy-match the user sheet name to the local XLSX list (80% cutoff).
       - Load col A from that sheet, pick movies, build a YT playlist, etc.
     """
+    # Ignore Start while a previous run is still resolving trailers
+    if str(start_button["state"]) == "disabled":
+        return
+
     # Validate # of attendees
     try:
         attendee_count = int(num_people_entry.get().strip())
@@ -422,33 +822,11 @@ def on_start(event=None):
             log_debug(f"[ERROR auto-downloading xlsx]: {e}")
             return messagebox.showerror("Error", "No local XLSX found. Try 'Update Sheets' first.")
 
-    # All actual sheet names
-    actual_sheets = get_all_sheet_names_local(GHIB_FILE)
-
-    # Create a map { normalized_name -> actual_sheet_name }
-    # e.g. "mysheet" -> "My Sheet"
-    # (strip spaces + lowercase)
-    sheet_map = {}
-    for s in actual_sheets:
-        norm = re.sub(r"\s+", "", s.lower())
-        sheet_map[norm] = s
-
-    # 1) Try direct normal comparison
-    user_normal = re.sub(r"\s+", "", raw_sheet_input.lower())
-    chosen_sheet = sheet_map.get(user_normal)
-
-    # 2) If not found, do fuzzy search on the keys
-    if not chosen_sheet:
-        possible_keys = list(sheet_map.keys())
-        best_key = fuzzy_search(user_normal, possible_keys, cutoff=0.8)
-        if best_key:
-            chosen_sheet = sheet_map[best_key]
-
+    # Resolve the sheet and read its movies from a single workbook open
+    chosen_sheet, movies = load_sheet_movies(GHIB_FILE, raw_sheet_input)
     if not chosen_sheet:
         return messagebox.showerror("Error", f"No sheet matched '{raw_sheet_input}' (80% cutoff).")
 
-    # Now we have chosen_sheet as the actual sheet name
-    movies = fetch_movie_list_local(GHIB_FILE, chosen_sheet)
     if not movies or attendee_count > len(movies):
         return messagebox.showerror("Error", f"Insufficient movie data in sheet '{chosen_sheet}'.")
 
@@ -461,20 +839,59 @@ def on_start(event=None):
     selected_movies = pick_random_movies(movies, attendee_count + 1)
     playlist_video_ids = []
 
-    # Build up the left vs. right columns for displaying results
-    col_frame1 = tk.Frame(middle_frame, bg=BACKGROUND_COLOR)
-    col_frame1.grid(row=0, column=0, sticky="nw")
-
-    col_frame2 = tk.Frame(middle_frame, bg=BACKGROUND_COLOR)
-    col_frame2.grid(row=0, column=1, sticky="nw", padx=20)
-
-    current_column = col_frame1
-    lines_in_column = 0
-    max_lines_per_column = 20
+    # Results go into at most two read-only Text widgets (one per column)
+    # instead of a Label per movie: colours and click targets are text tags,
+    # so Tk lays out characters rather than re-flowing N widgets.
+    line_height = tkfont.nametofont("TkDefaultFont").metrics("linespace") + 4
+    max_lines = max(1, (middle_canvas.winfo_height() - 5) // line_height)
+    columns = []
+
+    def new_column():
+        text = tk.Text(
+            middle_frame, width=40, height=1, wrap="word",
+            font="TkDefaultFont", fg="white", bg=BACKGROUND_COLOR,
+            borderwidth=0, highlightthickness=0, cursor="arrow",
+            spacing1=2, spacing3=2
+        )
+        text.tag_config("fallback", foreground=FALLBACK_COLOR)
+        text.tag_config("missing", foreground=ERROR_COLOR)
+        text.tag_bind("link", "<Enter>", lambda e, t=text: t.config(cursor="hand2"))
+        text.tag_bind("link", "<Leave>", lambda e, t=text: t.config(cursor="arrow"))
+        text.grid(row=0, column=len(columns), sticky="nw", padx=(20 if columns else 0, 0))
+        columns.append(text)
+        return text
+
+    def display_lines(text) -> int:
+        count = text.count("1.0", "end-1c", "update", "displaylines")
+        count = count[0] if isinstance(count, tuple) else count
+        return (count or 0) + 1
+
+    # Producer (worker thread) resolves trailers and queues each result;
+    # the Tk thread drains the queue with root.after and renders labels.
+    results = queue.Queue()
+
+    def produce():
+        try:
+            # local JSON first, then every YouTube miss in one batch
+            misses = []
+            for movie in selected_movies:
+                url = lookup_trailer_json(chosen_sheet, movie)
+                if url:
+                    results.put((movie, url, "json", None))
+                else:
+                    misses.append(movie)
+            api_results = youtube_api_search_many([trailer_search_query(m) for m in misses])
+            for movie, api_result in zip(misses, api_results):
+                if api_result:
+                    results.put((movie, api_result[0], "youtube", api_result[1]))
+                else:
+                    results.put((movie, None, "", None))
+        except Exception as e:
+            log_debug(f"[ERROR] Trailer lookup failed: {e}")
+        finally:
+            results.put(None)  # sentinel: no more results
 
-    # Locate trailers and build the UI labels
-    for movie in selected_movies:
-        trailer, source, yt_video_title = locate_trailer(chosen_sheet, movie)
+    def render(movie, trailer, source, yt_video_title):
         display_text = movie
         color = "white"
 
@@ -482,57 +899,67 @@ def on_start(event=None):
             color = FALLBACK_COLOR
             display_text += f" (YT: {yt_video_title})"
 
-        if trailer and "youtube.com/watch?v=" in trailer:
-            # Extract the video ID
-            video_id = trailer.split("v=")[-1].split("&")[0]
-            playlist_video_ids.append(video_id)
-
-            label = tk.Label(
-                current_column, text=display_text, fg=color,
-                cursor="hand2", wraplength=280, justify="left",
-                bg=BACKGROUND_COLOR
-            )
-            label.pack(anchor="w", pady=2)
-            label.bind("<Button-1>", lambda e, url=trailer: open_in_windows_default(url))
+        # fill column 0 top to bottom, then overflow into column 1
+        if not columns or (len(columns) == 1 and display_lines(columns[0]) >= max_lines):
+            new_column()
+        text = columns[-1]
+        text.config(state="normal")
+        prefix = "\n" if text.compare("end-1c", "!=", "1.0") else ""
+
+        video_match = _VIDEO_ID_RE.search(trailer) if trailer else None
+        if video_match:
+            playlist_video_ids.append(video_match.group(1))
+            link_tag = f"link{len(playlist_video_ids)}"
+            tags = ("link", link_tag) + (("fallback",) if color == FALLBACK_COLOR else ())
+            text.insert("end", prefix + display_text, tags)
+            text.tag_bind(link_tag, "<Button-1>", lambda e, url=trailer: open_in_windows_default(url))
         else:
-            label = tk.Label(
-                current_column,
-                text=f"{movie}: No trailer found",
-                fg=ERROR_COLOR, wraplength=280, justify="left",
-                bg=BACKGROUND_COLOR
-            )
-            label.pack(anchor="w", pady=2)
-
+            text.insert("end", prefix + f"{movie}: No trailer found", ("missing",))
+
+        text.config(height=display_lines(text), state="disabled")
+
+    def drain():
+        while True:
+            try:
+                item = results.get_nowait()
+            except queue.Empty:
+                root.after(30, drain)
+                return
+            if item is None:
+                finish()
+                return
+            render(*item)
+
+    def finish():
         root.update_idletasks()
-        lines_in_column += 1
-        # Switch to second column if we run out of vertical space
-        if lines_in_column * (label.winfo_reqheight() + 4) >= middle_canvas.winfo_height() - 5 \
-           and current_column == col_frame1:
-            current_column = col_frame2
-            lines_in_column = 0
-
-    # If we have any trailer IDs, build a YouTube playlist
-    if playlist_video_ids:
-        title = f"Movie Night {datetime.date.today()}"
-        playlist_url = create_youtube_playlist(title, playlist_video_ids)
-        if playlist_url:
-            open_in_windows_default(playlist_url)
-
-        # Show random direction image
-        direction_img = load_direction_image()
-        if direction_img:
-            dir_label = tk.Label(right_frame, image=direction_img, bg=BACKGROUND_COLOR)
-            dir_label.image = direction_img  # keep a reference so it doesn't get GC'd
-            dir_label.pack(pady=10)
-
-        # Show random number image
-        number_img = load_random_image(NUMBERS_DIR, "number", attendee_count)
-        if number_img:
-            num_label = tk.Label(right_frame, image=number_img, bg=BACKGROUND_COLOR)
-            num_label.image = number_img
-            num_label.pack(pady=10)
-    else:
-        messagebox.showinfo("No Trailers", "No valid trailers found.")
+        start_button.config(state="normal")
+
+        # If we have any trailer IDs, build a YouTube playlist
+        if playlist_video_ids:
+            title = f"Movie Night {datetime.date.today()}"
+            playlist_url = create_youtube_playlist(title, playlist_video_ids)
+            if playlist_url:
+                open_in_windows_default(playlist_url)
+
+            # Show random direction image
+            direction_img = load_direction_image()
+            if direction_img:
+                dir_label = tk.Label(right_frame, image=direction_img, bg=BACKGROUND_COLOR)
+                dir_label.image = direction_img  # keep a reference so it doesn't get GC'd
+                dir_label.pack(pady=10)
+
+            # Show random number image
+            number_img = load_random_image(NUMBERS_DIR, "number", attendee_count)
+            if number_img:
+                num_label = tk.Label(right_frame, image=number_img, bg=BACKGROUND_COLOR)
+                num_label.image = number_img
+                num_label.pack(pady=10)
+        else:
+            messagebox.showinfo("No Trailers", "No valid trailers found.")
+
+    start_button.config(state="disabled")
+    threading.Thread(target=produce, daemon=True).start()
+    root.after(30, drain)
 
 
 # ---------------- MAIN APP WITH SCROLL AND DARK MODE ---------------- #
@@ -610,4 +1037,5 @@ update_button.pack(pady=5)
 
 root.bind('<Return>', on_start)
 center_window(root)
+prefetch_images(NUMBERS_DIR)
 root.mainloop()
\ No newline at end of file
@@ -1,18 +1,40 @@
+import asyncio
+import atexit
+import functools
 import os
-import sys
+import threading
 import json
+import logging
+import logging.handlers
+import queue
 import re
 import requests
 import openpyxl
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 from dotenv import load_dotenv
-import datetime
+import time
 from yt_dlp import YoutubeDL
 
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
 from google.oauth2.service_account import Credentials
 
+try:  # optional: Rust-backed xlsx reader, openpyxl otherwise
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+try:  # optional: faster JSON parse / dump, stdlib json otherwise
+    import orjson
+    _loads = orjson.loads
+    _dumps = lambda d: orjson.dumps(d, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    orjson = None
+    _loads = json.loads
+    _dumps = lambda d: json.dumps(d, ensure_ascii=False, indent=2)
+
 # ----------------- CONFIGURATION ----------------- #
 BASE_DIR = Path(__file__).resolve().parent
 ENV_PATH = BASE_DIR / "secret.env"
@@ -35,28 +57,67 @@ TRAILERS_DIR = BASE_DIR / "Video_Trailers"
 TRAILERS_DIR.mkdir(parents=True, exist_ok=True)
 
 LOG_FILE = BASE_DIR / "trailer_debug.log"
+MASTER_CACHE_INDEX = BASE_DIR / ".master_cache.json"
 
 GOOGLE_SERVICE_ACCOUNT_FILE = BASE_DIR / "service_secret.json"
 DRIVE_SCOPES = ["https://www.googleapis.com/auth/drive.readonly"]
 SHEETS_SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
 
 YOUTUBE_MAXED_OUT = False  # if True, skip further YT lookups
+MAX_CONCURRENT_LOOKUPS = 8  # missing titles resolved at once
+TMDB_MAX_IN_FLIGHT = 4      # TMDB allows ~40 req / 10 s per IP
+_TMDB_SLOTS = threading.BoundedSemaphore(TMDB_MAX_IN_FLIGHT)
+TMDB_429_RETRIES = 3        # Retry-After waits before giving up on one request
+
+# One keep-alive session for every TMDB / YouTube call so the TLS handshake
+# is paid once per host, not once per request. Transient 5xx are retried.
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "movieNight/1.0"})
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504]),
+)
+SESSION.mount("https://api.themoviedb.org", _ADAPTER)
+SESSION.mount("https://www.googleapis.com", _ADAPTER)
 
 # --------------- LOGGING & UTILS --------------- #
+# log_debug only pushes onto an in-memory queue; a QueueListener thread owns
+# the single file handle and does the disk writes, so lookup threads never
+# block on the log. The listener is stopped (and the queue flushed) at exit.
+_LOG_QUEUE = queue.SimpleQueue()
+_LOG_FILE_HANDLER = logging.FileHandler(LOG_FILE, encoding="utf-8")
+_LOG_FILE_HANDLER.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%dT%H:%M:%S"))
+_LOG_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, _LOG_FILE_HANDLER)
+_LOG_LISTENER.start()
+atexit.register(_LOG_LISTENER.stop)
+
+logger = logging.getLogger("autoUpdate")
+logger.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
+logger.setLevel(logging.DEBUG)
+logger.propagate = False
+
 def log_debug(message: str) -> None:
-    timestamp = datetime.datetime.now().isoformat(timespec='seconds')
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(f"[{timestamp}] {message}\n")
+    logger.debug(message)
+
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+_NORM_RE = re.compile(r'[^a-z0-9]')
 
 def sanitize_filename(name: str) -> str:
-    return re.sub(r'[<>:"/\\|?*]', '', name.strip())
+    return _SANITIZE_RE.sub('', name.strip())
 
+@functools.lru_cache(maxsize=8192)
 def normalize_title(title: str) -> str:
-    return re.sub(r'[^a-z0-9]', '', title.lower().strip())
+    # memoized: the same titles are normalized for the master cache, the
+    # cross-sheet dedupe and again when results are written back
+    return _NORM_RE.sub('', title.lower())
 
 def print_progress_bar(iteration: int, total: int, prefix: str="", suffix: str="", length: int=40):
     if total <= 0:
         return
+    # only redraw when the bar can actually move (plus the final 100% frame)
+    if iteration % max(1, total // length) != 0 and iteration < total:
+        return
     fraction = iteration / float(total)
     filled_length = int(length * fraction)
     bar = "█" * filled_length + "-" * (length - filled_length)
@@ -126,28 +187,88 @@ def get_non_green_tabs(spreadsheet_id: str):
     return result
 
 # ---------------- XLSX READING ---------------- #
-def get_all_sheet_names_local(xlsx_file: Path):
-    wb = openpyxl.load_workbook(xlsx_file, read_only=True)
-    return wb.sheetnames
-
-def fetch_movie_list_local(xlsx_file: Path, sheet_name: str):
-    wb = openpyxl.load_workbook(xlsx_file, read_only=True)
-    if sheet_name not in wb.sheetnames:
-        log_debug(f"[ERROR] Sheet '{sheet_name}' not found in {xlsx_file.name}.")
+def load_workbook_local(xlsx_file: Path):
+    """
+    Open the xlsx once for every sheet read in a run: CalamineWorkbook when
+    python-calamine is installed, else openpyxl (read-only, cached values).
+    """
+    if CalamineWorkbook is not None:
+        return CalamineWorkbook.from_path(str(xlsx_file))
+    return openpyxl.load_workbook(xlsx_file, read_only=True, data_only=True)
+
+def get_all_sheet_names_local(wb):
+    return wb.sheet_names if CalamineWorkbook is not None else wb.sheetnames
+
+def fetch_movie_list_local(wb, sheet_name: str):
+    if sheet_name not in get_all_sheet_names_local(wb):
+        log_debug(f"[ERROR] Sheet '{sheet_name}' not found in workbook.")
         return []
-    sheet = wb[sheet_name]
+    if CalamineWorkbook is not None:
+        rows = wb.get_sheet_by_name(sheet_name).to_python()
+    else:
+        rows = wb[sheet_name].iter_rows(min_row=1, max_col=1, values_only=True)
     movies = []
-    for row in sheet.iter_rows(min_row=1, max_col=1, values_only=True):
-        val = row[0]
-        if val and str(val).strip():
-            movies.append(str(val).strip())
+    for row in rows:
+        val = row[0] if row else None
+        if val is None:
+            continue
+        if isinstance(val, float) and val.is_integer():
+            val = int(val)  # calamine returns numeric cells as float
+        text = (val if isinstance(val, str) else str(val)).strip()  # convert/strip once
+        if text:
+            movies.append(text)
     return movies
 
+# ---------------- TMDB RATE LIMIT ---------------- #
+class RateLimiter:
+    """
+    Thread-safe token bucket: at most `rate` calls per `per` seconds, with
+    bursts up to `rate`. acquire() blocks until a token is available.
+    """
+    def __init__(self, rate: int, per: float):
+        self.capacity = rate
+        self.tokens = float(rate)
+        self.rate = rate
+        self.per = per
+        self.t = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.t) * self.rate / self.per)
+            self.t = now
+            if self.tokens < 1:
+                # sleep under the lock so waiters are served in order
+                time.sleep((1 - self.tokens) * self.per / self.rate)
+                self.t = time.monotonic()
+                self.tokens = 1.0
+            self.tokens -= 1
+
+TMDB_LIMIT = RateLimiter(35, 10)  # margin under TMDB's 40 req / 10 s
+
+def _tmdb_get(url: str, params: dict):
+    """GET a TMDB endpoint under the rate limit; wait out a 429 instead of exiting."""
+    for attempt in range(TMDB_429_RETRIES + 1):
+        TMDB_LIMIT.acquire()
+        with _TMDB_SLOTS:
+            resp = SESSION.get(url, params=params, timeout=10)
+        if resp.status_code != 429 or attempt == TMDB_429_RETRIES:
+            return resp
+        try:
+            wait = float(resp.headers.get("Retry-After", "5"))
+        except ValueError:
+            wait = 5.0
+        log_debug(f"[TMDB] 429 => sleeping {wait:g}s before retrying {url}")
+        time.sleep(wait)
+    return resp
+
 # ---------------- TMDB + YOUTUBE ---------------- #
 def tmdb_find_trailer(movie_title: str):
     global YOUTUBE_MAXED_OUT
     try:
         norm_query = normalize_title(movie_title)
+        norm_sub = _NORM_RE.sub
         all_results = []
         for page in [1, 2]:
             search_url = "https://api.themoviedb.org/3/search/movie"
@@ -157,13 +278,12 @@ def tmdb_find_trailer(movie_title: str):
                 "page": page
             }
             log_debug(f"[TMDB] Searching page={page} for '{movie_title}'")
-            resp = requests.get(search_url, params=params, timeout=10)
+            resp = _tmdb_get(search_url, params)
             if resp.status_code == 429:
-                log_debug("[TMDB] 429 => daily limit. Exiting.")
-                print("TMDB daily quota limit reached. Exiting.")
-                sys.exit(1)
+                log_debug(f"[TMDB] Still 429 after retries => fallback to YT for '{movie_title}'")
+                return None
 
-            data = resp.json()
+            data = _loads(resp.content)
             page_results = data.get("results", [])
             if not page_results:
                 break
@@ -172,17 +292,17 @@ def tmdb_find_trailer(movie_title: str):
             total_pages = data.get("total_pages", 1)
             if page >= total_pages:
                 break
+            # An exact hit on page 1 decides the lookup; skip the page-2 request.
+            if any(norm_sub('', r.get("title", "").lower()) == norm_query for r in page_results):
+                log_debug(f"[TMDB] Exact match on page {page} => skipping later pages for '{movie_title}'")
+                break
 
         log_debug(f"[TMDB] Found {len(all_results)} total results for '{movie_title}' (p1-2).")
         if not all_results:
             log_debug(f"[TMDB] No results => fallback to YT for '{movie_title}'")
             return None
 
-        matched = []
-        for r in all_results:
-            rtitle = r.get("title", "")
-            if normalize_title(rtitle) == norm_query:
-                matched.append(r)
+        matched = [r for r in all_results if norm_sub('', r.get("title", "").lower()) == norm_query]
 
         log_debug(f"[TMDB] {len(matched)} EXACT matches for '{movie_title}'")
         if len(matched) == 0 or len(matched) >= 3:
@@ -199,22 +319,23 @@ def tmdb_find_trailer(movie_title: str):
         # fetch /videos
         videos_url = f"https://api.themoviedb.org/3/movie/{movie_id}/videos"
         vid_params = {"api_key": TMDB_API_KEY}
-        vids_resp = requests.get(videos_url, params=vid_params, timeout=10)
+        vids_resp = _tmdb_get(videos_url, vid_params)
         if vids_resp.status_code == 429:
-            log_debug("[TMDB] 429 => daily limit while fetching /videos. Exiting.")
-            print("TMDB daily quota limit reached. Exiting.")
-            sys.exit(1)
+            log_debug(f"[TMDB] Still 429 on /videos after retries => fallback to YT for '{movie_title}'")
+            return None
 
         max_video_duraction = 50
         youtubeLink = "https://www.youtube.com/watch?v="
-        vids_data = vids_resp.json().get("results", [])
+        vids_data = _loads(vids_resp.content).get("results", [])
         for vid in vids_data:
             if vid.get("site") == "YouTube" and vid.get("type") in ("Trailer"):
                 key = vid.get("key")
                 if key:
                     YTFullLink = youtubeLink + key
-                    if get_video_duration_sec(YTFullLink) <= max_video_duraction:
-                        log_debug(f"[TMDB] Fallback to YT, {movie_title} video too long, <=50 secs {get_video_duration_sec(matched)}")
+                    # one yt-dlp probe per candidate; the log line reuses it
+                    duration = get_video_duration_sec(YTFullLink)
+                    if duration is None or duration <= max_video_duraction:
+                        log_debug(f"[TMDB] Fallback to YT, {movie_title} video too short, <=50 secs ({duration})")
                         return None
                     else:
                         log_debug(f"[TMDB] Found YT key={key} for '{movie_title}'")
@@ -243,9 +364,9 @@ def youtube_api_search(query: str):
             "maxResults": 1,
             "type": "video"
         }
-        resp = requests.get(search_url, params=params, timeout=10)
+        resp = SESSION.get(search_url, params=params, timeout=10)
         if resp.status_code == 403:
-            error_data = resp.json().get("error", {})
+            error_data = _loads(resp.content).get("error", {})
             reason_list = error_data.get("errors", [])
             for er in reason_list:
                 reason = er.get("reason", "")
@@ -257,7 +378,7 @@ def youtube_api_search(query: str):
             log_debug(f"[YouTube] 403 error but not recognized reason => none.")
             return None
 
-        data = resp.json()
+        data = _loads(resp.content)
         items = data.get("items", [])
         if items:
             video_id = items[0]["id"]["videoId"]
@@ -309,11 +430,26 @@ def find_trailer_fallback_cache(movie_title: str, master_cache: dict):
 
 # -------------- MASTER CACHE -------------- #
 def build_master_cache_from_all_json() -> dict:
+    """
+    {normalized title: url} across every sheet JSON. The result is saved to
+    MASTER_CACHE_INDEX with a (name, mtime) fingerprint of the JSON files, so
+    a run where nothing changed loads one file instead of re-parsing them all.
+    """
+    json_files = list(TRAILERS_DIR.glob("*.json"))
+    fingerprint = sorted([p.name, p.stat().st_mtime_ns] for p in json_files)
+    if MASTER_CACHE_INDEX.exists():
+        try:
+            blob = _loads(MASTER_CACHE_INDEX.read_bytes())
+            if blob.get("fp") == fingerprint:
+                log_debug("[CACHE] Master cache index is current; skipping JSON scan.")
+                return blob["cache"]
+        except (json.JSONDecodeError, KeyError, AttributeError):
+            pass
+
     master_cache = {}
-    for json_file in TRAILERS_DIR.glob("*.json"):
+    for json_file in json_files:
         try:
-            text = json_file.read_text(encoding="utf-8")
-            data = json.loads(text)
+            data = _loads(json_file.read_bytes())
         except json.JSONDecodeError:
             data = {}
         for title, url in data.items():
@@ -321,25 +457,21 @@ def build_master_cache_from_all_json() -> dict:
                 norm = normalize_title(title)
                 if norm not in master_cache:
                     master_cache[norm] = url
+
+    MASTER_CACHE_INDEX.write_text(_dumps({"fp": fingerprint, "cache": master_cache}), encoding="utf-8")
     return master_cache
 
 # -------------- JSON HELPERS -------------- #
 def load_json_dict(json_path: Path):
     try:
-        return json.loads(json_path.read_text(encoding="utf-8"))
+        return _loads(json_path.read_bytes())
     except json.JSONDecodeError:
         return {}
 
 def write_json_dict(json_path: Path, data: dict):
-    lines = ["{"]
-    keys = list(data.keys())
-    for i, key in enumerate(keys):
-        comma = "," if i < len(keys) - 1 else ""
-        val = data[key] or ""
-        val_escaped = val.replace('"', '\\"')
-        lines.append(f'  "{key}": "{val_escaped}"{comma}')
-    lines.append("}")
-    json_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    # missing URLs are stored as "" rather than null, as before
+    payload = {key: val or "" for key, val in data.items()}
+    json_path.write_text(_dumps(payload) + "\n", encoding="utf-8")
 
 def ensure_url_json_exists(sheet_name: str) -> Path:
     safe_sheet_name = sanitize_filename(sheet_name).replace(" ", "")
@@ -350,25 +482,54 @@ def ensure_url_json_exists(sheet_name: str) -> Path:
     return json_file
 
 # -------------- FILL MISSING URLS -------------- #
-def fill_missing_urls_in_json_with_cache(json_file: Path, movies: list, master_cache: dict):
+async def _lookup_missing(missing_entries: list, master_cache: dict) -> dict:
+    """
+    Resolve every missing title concurrently (bounded by MAX_CONCURRENT_LOOKUPS)
+    and return {title: url_or_None}. The lookup helpers are blocking (requests,
+    yt-dlp), so each runs on a worker thread; the event loop only schedules them
+    and drives the progress bar as results come in.
+    """
+    sem = asyncio.Semaphore(MAX_CONCURRENT_LOOKUPS)
+
+    async def worker(movie_title: str):
+        async with sem:
+            url = await asyncio.to_thread(find_trailer_fallback_cache, movie_title, master_cache)
+            return movie_title, url
+
+    total = len(missing_entries)
+    found = {}
+    print_progress_bar(0, total, prefix="Progress", suffix="Complete")
+    for done, next_result in enumerate(asyncio.as_completed([worker(m) for m in missing_entries]), start=1):
+        movie_title, url = await next_result
+        found[movie_title] = url
+        print_progress_bar(done, total, prefix="Progress", suffix="Complete")
+    return found
+
+def prepare_sheet_json(json_file: Path, movies: list):
+    """
+    Load json_file, add "" entries for movies it doesn't list yet, and return
+    (data, missing_titles) where missing_titles have no URL.
+    """
     data = load_json_dict(json_file)
+    # one pass: register new titles and collect everything without a URL
+    missing_entries = []
     for m in movies:
-        if m not in data:
+        url = data.get(m)
+        if url is None:
             data[m] = ""
-
-    missing_entries = [m for m in movies if not data[m]]
-    total_missing = len(missing_entries)
-    if total_missing == 0:
+            missing_entries.append(m)
+        elif not url:
+            missing_entries.append(m)
+    if not missing_entries:
         log_debug(f"[INFO] No missing URLs for {json_file.name}.")
         print(f"No missing URLs in {json_file.name} — skipping searches.")
-        return
+    return data, missing_entries
 
-    print(f"\nFilling missing URLs in {json_file.name}: {total_missing} to search.")
+def apply_found_urls(json_file: Path, data: dict, missing_entries: list, found_by_norm: dict):
+    """Write the URLs found for missing_entries (keyed by normalized title) into json_file."""
     updated = False
-
-    for i, movie_title in enumerate(missing_entries, start=1):
-        print_progress_bar(i - 1, total_missing, prefix="Progress", suffix="Complete")
-        trailer_url = find_trailer_fallback_cache(movie_title, master_cache)
+    for movie_title in missing_entries:
+        trailer_url = found_by_norm.get(normalize_title(movie_title))
         if trailer_url:
             data[movie_title] = trailer_url
             updated = True
@@ -376,8 +537,6 @@ def fill_missing_urls_in_json_with_cache(json_file: Path, movies: list, master_c
         else:
             log_debug(f"[INFO] No trailer found for '{movie_title}'")
 
-    print_progress_bar(total_missing, total_missing, prefix="Progress", suffix="Complete")
-
     if updated:
         write_json_dict(json_file, data)
         log_debug(f"[INFO] Updated JSON: {json_file}")
@@ -385,12 +544,12 @@ def fill_missing_urls_in_json_with_cache(json_file: Path, movies: list, master_c
     else:
         print(f"No valid trailer links found for any missing titles in {json_file.name}")
 
-
 def fill_missing_urls_for_non_green_sheets():
     """
     1) Download .xlsx
     2) Read remote sheet metadata, skip green tabs
-    3) For each non-green tab => fill JSON
+    3) Collect the missing titles of every non-green tab
+    4) Search them all in one concurrent batch, then fill each JSON
     """
     # 1) Download
     download_spreadsheet_as_xlsx(SPREADSHEET_ID, GHIB_FILE)
@@ -404,30 +563,54 @@ def fill_missing_urls_for_non_green_sheets():
     # 3) Master cache
     master_cache = build_master_cache_from_all_json()
 
-    # 4) For each non-green sheet, fill JSON
-    wb = openpyxl.load_workbook(GHIB_FILE, read_only=True)
+    # 4) Collect every non-green sheet's missing titles (one workbook open for all sheets)
+    wb = load_workbook_local(GHIB_FILE)
+    sheet_names = get_all_sheet_names_local(wb)
+    pending = []  # (json_file, data, missing_entries)
     for sheet_name in non_green:
-        if sheet_name not in wb.sheetnames:
+        if sheet_name not in sheet_names:
             log_debug(f"[INFO] Non-green sheet '{sheet_name}' not found in local xlsx (maybe renamed?).")
             continue
 
-        movies = []
-        sheet = wb[sheet_name]
-        for row in sheet.iter_rows(min_row=1, max_col=1, values_only=True):
-            val = row[0]
-            if val and str(val).strip():
-                movies.append(str(val).strip())
+        movies = fetch_movie_list_local(wb, sheet_name)
 
         if not movies:
             log_debug(f"[INFO] Sheet '{sheet_name}' has no movies in col A.")
             continue
 
         json_file = ensure_url_json_exists(sheet_name)
-        fill_missing_urls_in_json_with_cache(json_file, movies, master_cache)
+        data, missing_entries = prepare_sheet_json(json_file, movies)
+        if missing_entries:
+            pending.append((json_file, data, missing_entries))
+    if hasattr(wb, "close"):
+        wb.close()  # read-only mode keeps the zip open until closed
+
+    # 5) One batch across all sheets: the shared semaphore / TMDB limiter stay
+    #    busy instead of idling between sheets, and a title (or spelling variant)
+    #    that appears on several sheets is searched once
+    if pending:
+        to_search = {}
+        for _, _, missing_entries in pending:
+            for m in missing_entries:
+                to_search.setdefault(normalize_title(m), m)
+        print(f"\nSearching {len(to_search)} unique titles across {len(pending)} sheets.")
+        found = asyncio.run(_lookup_missing(list(to_search.values()), master_cache))
+        found_by_norm = {normalize_title(t): url for t, url in found.items()}
+
+        for json_file, data, missing_entries in pending:
+            apply_found_urls(json_file, data, missing_entries, found_by_norm)
 
     print("\nAll non-green sheets processed! Check 'trailer_debug.log' for logs.")
 
 # -------------- MAIN -------------- #
-if __name__ == "__main__":
+def main():
+    """Entry point shared by the CLI and the GUI's 'Update URLs' button."""
+    global YOUTUBE_MAXED_OUT
+    # the GUI imports this module once and calls main() per click, so the
+    # quota flag from an earlier run must not carry over
+    YOUTUBE_MAXED_OUT = False
     fill_missing_urls_for_non_green_sheets()
-    print("Done!")
\ No newline at end of file
+
+if __name__ == "__main__":
+    main()
+    print("Done!")
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
+import atexit
 import datetime
-import importlib
+import functools
+import html
 import json
 import os
 import random
 import re
-import subprocess
+import string
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Tuple
 
 import openpyxl
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
@@ -22,16 +28,31 @@ from difflib import get_close_matches
 
 import urllib.parse
 
+try:                                    # optional: faster JSON parse / dump
+    import orjson
+except ImportError:
+    orjson = None
+
+try:                                    # optional: Rust xlsx reader
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+try:                                    # optional: C++ fuzzy matcher
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:
+    fuzz_process = None
+
 #Gui 
 try:
-    from PySide6.QtCore import Qt, QUrl, Slot, QPropertyAnimation
-    from PySide6.QtGui import QAction, QIcon, QColor, QPalette, QDesktopServices, QPixmap, QPainter, QFont, QColor   
+    from PySide6.QtCore import Qt, QUrl, Slot, Signal, QObject, QRunnable, QThreadPool
+    from PySide6.QtGui import QAction, QIcon, QColor, QPalette, QDesktopServices, QPixmap, QPainter, QFont
     from PySide6.QtWidgets import (
         QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
         QListWidget, QListWidgetItem, QLabel, QStackedWidget, QPushButton,
-        QLineEdit, QSplitter, QScrollArea, QTableWidget,
+        QLineEdit, QSplitter, QTableWidget,
         QDialog, QCheckBox, QDialogButtonBox, QMessageBox, QGraphicsDropShadowEffect, QSizePolicy,
-        QFrame, QGridLayout, QFrame,QProgressBar
+        QFrame, QProgressBar, QTextBrowser
     )
 except ModuleNotFoundError as exc:
     sys.stderr.write(
@@ -56,12 +77,16 @@ SERVICE_ACCOUNT_KEY = BASE_DIR / "service_secret.json"         # not used direct
 CLIENT_SECRET_PATH  = BASE_DIR / "client_secret.json"
 USER_TOKEN_PATH     = BASE_DIR / "youtube_token.pickle"
 LOG_PATH            = BASE_DIR / "trailer_debug.log"
-AUTO_UPDATE_SCRIPT  = BASE_DIR / "autoUpdate.py"
 
 # constants
 ICON                = lambda name: QIcon(str(BASE_DIR / "icons" / f"{name}.svg"))
 ACCENT_COLOR        = "#3b82f6"
 YOUTUBE_SEARCH_URL  = "https://www.googleapis.com/youtube/v3/search"
+_YT_ID_RE           = re.compile(r"(?:[?&]v=|youtu\.be/)([A-Za-z0-9_-]{11})")
+_NON_ALNUM_RE       = re.compile(r"[^a-z0-9]")
+_WHITESPACE_RE      = re.compile(r"\s+")
+# ASCII fast path for normalize(): delete everything but a-z / 0-9 in C
+_NORMALIZE_TABLE    = {c: None for c in range(128) if chr(c) not in string.ascii_lowercase + string.digits}
 DRIVE_SCOPES        = ["https://www.googleapis.com/auth/drive.readonly"]
 YOUTUBE_SCOPES      = ["https://www.googleapis.com/auth/youtube"]
 
@@ -76,33 +101,118 @@ if not SPREADSHEET_ID or not YOUTUBE_API_KEY:
 #-placeholder- 
 
 # ────────────────────────── Logging helper ─────────────────────────
-def log_debug(message: str) -> None:
-    """
-    Append a timestamped debug line to LOG_PATH.
+# one line-buffered handle for the whole session instead of open/append/close
+# per message; closed on interpreter exit.
+LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+_LOG_FH   = LOG_PATH.open("a", encoding="utf-8", buffering=1)
+_LOG_LOCK = threading.Lock()
+atexit.register(_LOG_FH.close)
 
-    Uses Path.write_text(..., append=True) when available (3.12+),
-    otherwise falls back to explicit 'a' mode open – so it never crashes.
-    """
-    LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.datetime.now().isoformat(timespec="seconds")
-    log_line = f"[{timestamp}] {message}\n"
-
-    try:
-        # Python ≥ 3.12
-        LOG_PATH.write_text(log_line, encoding="utf-8", append=True)  # type: ignore[arg-type]
-    except TypeError:
-        # Older Python – no 'append' kwarg
-        with LOG_PATH.open("a", encoding="utf-8") as f:
-            f.write(log_line)
+def log_debug(message: str) -> None:
+    """Append a timestamped debug line to LOG_PATH."""
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+    with _LOG_LOCK:
+        _LOG_FH.write(f"[{timestamp}] {message}\n")
 
 # ────────────────────────── Tiny utilities ─────────────────────────
 def normalize(text: str) -> str:
     """Lower-case, strip, and drop non-alphanumerics (for fuzzy keys)."""
-    return re.sub(r"[^a-z0-9]", "", text.lower().strip())
+    text = text.lower()
+    if text.isascii():
+        return text.translate(_NORMALIZE_TABLE)
+    return _NON_ALNUM_RE.sub("", text)
+
+
+def parse_json_bytes(raw: bytes):
+    """Parse JSON from raw bytes (orjson when installed)."""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def load_json_file(path: Path) -> dict:
+    """Parse a JSON file from raw bytes (orjson when installed)."""
+    return parse_json_bytes(path.read_bytes())
+
+
+def dump_json_file(path: Path, data: dict) -> None:
+    """
+    Write `data` as 2-space indented JSON with a trailing newline.
+    Goes through a temp file + os.replace so a crash mid-write can't
+    leave a truncated file behind.
+    """
+    if orjson:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        payload = (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+
+
+def _cell_text(val) -> str:
+    """Cell value -> stripped string (calamine's 1917.0 becomes '1917')."""
+    if isinstance(val, float) and val.is_integer():
+        val = int(val)
+    return (val if isinstance(val, str) else str(val)).strip()
+
+
+def _open_workbook(path: Path):
+    """CalamineWorkbook when installed, else a read-only openpyxl workbook."""
+    if CalamineWorkbook is not None:
+        return CalamineWorkbook.from_path(str(path))
+    return openpyxl.load_workbook(path, read_only=True, data_only=True)
+
+
+def _sheet_names(workbook) -> List[str]:
+    return workbook.sheet_names if CalamineWorkbook is not None else workbook.sheetnames
+
+
+def _read_column_a(workbook, sheet_name: str) -> List[str]:
+    """Stripped, non-empty column-A values of `sheet_name`."""
+    if CalamineWorkbook is not None:
+        rows = workbook.get_sheet_by_name(sheet_name).to_python()
+    else:
+        # bound the scan by max_row so padded sheets don't stream empty rows
+        sheet = workbook[sheet_name]
+        rows = sheet.iter_rows(min_row=1, max_row=sheet.max_row, max_col=1, values_only=True)
+    titles = []
+    for row in rows:
+        if row and row[0] is not None and (text := _cell_text(row[0])):
+            titles.append(text)
+    return titles
+
+
+def _close_workbook(workbook) -> None:
+    # read-only openpyxl keeps the zip open, which blocks the next download on Windows
+    if hasattr(workbook, "close"):
+        workbook.close()
+
+
+@functools.lru_cache(maxsize=4)
+def _sheet_index(path: Path, mtime_ns: int) -> Tuple[dict, List[str]]:
+    """({normalized sheet name: sheet name}, normalized keys) for one file version."""
+    workbook = _open_workbook(path)
+    try:
+        sheet_map = {normalize(name): name for name in _sheet_names(workbook)}
+    finally:
+        _close_workbook(workbook)
+    return sheet_map, list(sheet_map)
+
+
+@functools.lru_cache(maxsize=16)
+def _sheet_titles(path: Path, mtime_ns: int, sheet_name: str) -> Tuple[str, ...]:
+    """Column-A titles of `sheet_name`, read once per file version."""
+    workbook = _open_workbook(path)
+    try:
+        return tuple(_read_column_a(workbook, sheet_name))
+    finally:
+        _close_workbook(workbook)
 
 
 def fuzzy_match(target: str, candidates: List[str], cutoff: float = 0.8) -> Optional[str]:
     """Return best fuzzy match or None."""
+    if fuzz_process is not None:
+        best = fuzz_process.extractOne(target, candidates, scorer=fuzz.ratio, score_cutoff=cutoff * 100)
+        return best[0] if best else None
     matches = get_close_matches(target, candidates, n=1, cutoff=cutoff)
     return matches[0] if matches else None
  
@@ -148,43 +258,57 @@ def resizeEvent(self, event):
     self.number_label.setPixmap(num_pix)
     
 # ───────────────────────── trailer-report helper ─────────────────────────
-def report_trailer(movie_name: str, youtube_url: str | None) -> None:
+def report_trailers(reports: dict[str, str | None]) -> None:
     """
-    Add/overwrite an entry in underReviewURLs.json and pop a confirmation.
+    Add/overwrite entries in underReviewURLs.json for every movie in
+    `reports` ({movie: youtube_url}).
 
-    JSON is written pretty-printed (indented, one key per line) so it’s easy
-    to read or edit by hand.
+    The file is read once and written once per batch, pretty-printed
+    (indented, one key per line) so it’s easy to read or edit by hand.
     """
+    if not reports:
+        return
+
     # 1) make sure the file exists
     if not UNDER_REVIEW_PATH.exists():
         UNDER_REVIEW_PATH.write_text("{}", encoding="utf-8")
 
     # 2) read existing contents (gracefully handle bad JSON)
     try:
-        data: dict[str, str] = json.loads(UNDER_REVIEW_PATH.read_text("utf-8"))
-    except json.JSONDecodeError:
+        data: dict[str, str] = load_json_file(UNDER_REVIEW_PATH)
+    except json.JSONDecodeError:        # orjson's error subclasses this too
         data = {}
 
-    # 3) update / set the entry
-    data[movie_name] = youtube_url or ""
+    # 3) stage every entry in memory
+    for movie_name, youtube_url in reports.items():
+        data[movie_name] = youtube_url or ""
+        log_debug(f"[REPORT] Marked “{movie_name}” → {youtube_url} as under review.")
 
-    # 4) write it back – pretty JSON, Unix newlines, trailing newline
-    UNDER_REVIEW_PATH.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
-
-    # 5) log and notify
-    log_debug(f"[REPORT] Marked “{movie_name}” → {youtube_url} as under review.")
-    QMessageBox.information(
-        None,
-        "Trailer reported",
-        f"Marked “{movie_name}” for manual review."
-    )
+    # 4) one write for the whole batch – pretty JSON, trailing newline
+    dump_json_file(UNDER_REVIEW_PATH, data)
 
 # ────────────────────────── YouTube helpers ────────────────────────
+# one keep-alive session so fallback searches share the TLS connection
+_YT_SESSION = requests.Session()
+_YT_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+
+class _NoYouTubeResult(Exception):
+    """Raised inside the cached search so misses and errors are not cached."""
+
+
 def search_youtube_api(query: str) -> Optional[Tuple[str, str]]:
     """Return (url, video_title) for first short video result or None."""
+    try:
+        return _search_youtube_cached(query)
+    except _NoYouTubeResult:
+        return None
+
+
+# query -> (url, video_title); only hits are kept so a transient API error
+# is retried on the next call. Re-rolls and reports reuse earlier answers.
+@functools.lru_cache(maxsize=512)
+def _search_youtube_cached(query: str) -> Tuple[str, str]:
     params = {
         "part": "snippet",
         "q": query,
@@ -194,8 +318,8 @@ def search_youtube_api(query: str) -> Optional[Tuple[str, str]]:
         "type": "video",
     }
     try:
-        response = requests.get(YOUTUBE_SEARCH_URL, params=params, timeout=10)
-        data = response.json()
+        response = _YT_SESSION.get(YOUTUBE_SEARCH_URL, params=params, timeout=10)
+        data = parse_json_bytes(response.content)
         if data.get("items"):
             first = data["items"][0]
             video_id = first["id"]["videoId"]
@@ -203,7 +327,18 @@ def search_youtube_api(query: str) -> Optional[Tuple[str, str]]:
             return f"https://www.youtube.com/watch?v={video_id}", title
     except Exception as exc:
         log_debug(f"YouTube search error: {exc}")
-    return None
+    raise _NoYouTubeResult(query)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_normalized_urls(urls_path: Path, mtime: float) -> Tuple[dict, List[str]]:
+    """
+    Parse `<sheet>Urls.json` once and return ({normalized title: url}, keys).
+    Keyed on mtime so an 'Update URLs' run invalidates the entry.
+    """
+    data = load_json_file(urls_path)
+    normalized = {normalize(k): v for k, v in data.items()}
+    return normalized, list(normalized)
 
 
 def locate_trailer(work_sheet: str, movie_title: str) -> Tuple[Optional[str], str, Optional[str]]:
@@ -211,14 +346,16 @@ def locate_trailer(work_sheet: str, movie_title: str) -> Tuple[Optional[str], st
     Try local JSON first, then YouTube API.
     Returns (url, source, api_title) where source is 'json' or 'youtube'.
     """
-    json_name = re.sub(r"\s+", "", work_sheet)
+    json_name = _WHITESPACE_RE.sub("", work_sheet)
     urls_path = TRAILER_FOLDER / f"{json_name}Urls.json"
 
     if urls_path.exists():
-        data = json.loads(urls_path.read_text(encoding="utf-8"))
-        normalized = {normalize(k): v for k, v in data.items()}
+        normalized, keys = _load_normalized_urls(urls_path, urls_path.stat().st_mtime)
         key = normalize(movie_title)
-        url = normalized.get(key) or normalized.get(fuzzy_match(key, list(normalized)) or "")
+        url = normalized.get(key)
+        if url is None:                 # not in the sheet: try a fuzzy key
+            match = fuzzy_match(key, keys)
+            url = normalized.get(match) if match else None
         if url:
             return url, "json", None
 
@@ -264,8 +401,15 @@ def create_youtube_playlist(title: str, video_ids: List[str]) -> Optional[str]:
         ).execute()
 
         playlist_id = playlist["id"]
+
+        def on_item_added(request_id, response, exception):
+            if exception is not None:
+                log_debug(f"[PLAYLIST] item #{request_id} failed: {exception}")
+
+        # one multipart batch request instead of a round trip per video
+        batch = youtube.new_batch_http_request(callback=on_item_added)
         for vid in video_ids:
-            youtube.playlistItems().insert(
+            batch.add(youtube.playlistItems().insert(
                 part="snippet",
                 body={
                     "snippet": {
@@ -273,7 +417,8 @@ def create_youtube_playlist(title: str, video_ids: List[str]) -> Optional[str]:
                         "resourceId": {"kind": "youtube#video", "videoId": vid},
                     }
                 },
-            ).execute()
+            ))
+        batch.execute()
 
         return f"https://www.youtube.com/playlist?list={playlist_id}"
     except Exception as exc:
@@ -282,90 +427,66 @@ def create_youtube_playlist(title: str, video_ids: List[str]) -> Optional[str]:
 
 # ──────────────────────── Database Calls ─────────────────
 DATABASE = movie_night_repository
+_get_prob = DATABASE.get_prob           # resolved once, called per picked title
 def movie_probability(title: str) -> float:
-    return DATABASE.get_prob(title)
+    return _get_prob(title)
 def calculate_weighted_totals(titles):
     # to do will calculate combined weighted total, will call probability
     return DATABASE.get_calc_weighted_ratings(titles) 
 def calculate_group_similarity(titles):
     return DATABASE.get_similarity(titles)  
 # ────────────────────────── GUI widgets ───────────────────────────
-class MovieCard(QFrame):
-    """A single movie “card” with hover‐shadow animation."""
-    def __init__(self,
-                    title: str,
-                    url: str,
-                    probability: float,
-                    parent: QWidget | None = None):
-        super().__init__(parent)
-        self.setObjectName("MovieCardItem")
-        self.setFrameShape(QFrame.StyledPanel)
-        self.setFrameShadow(QFrame.Raised)
-
-        # layout
-        lay = QVBoxLayout(self)
-        lay.setContentsMargins(8, 8, 8, 8)
-        lay.setSpacing(6)
-        
-         # Title (clickable link)
-        title_lbl = QLabel(f'<a href="{url}">{title}</a>')
-        title_lbl.setTextFormat(Qt.RichText)
-        title_lbl.setTextInteractionFlags(Qt.TextBrowserInteraction)
-        title_lbl.setOpenExternalLinks(True)
-        title_lbl.setWordWrap(True)
-        title_lbl.setProperty("class", "MovieTitle")
-        lay.addWidget(title_lbl)
-
-        # Probability pill with background colour and padding
-        prob_str = f"{probability:.2f}"
-        prob_lbl = QLabel(prob_str, alignment=Qt.AlignCenter)
-
-        # pick background colour
-        if   probability >= 0.7:
-            pill_bg = "#2ecc71"    # green
-            text_color = "#000"
-        elif probability >= 0.4:
-            pill_bg = "#f1c40f"    # yellow
-            text_color = "#000"
-        else:
-            pill_bg = ACCENT_COLOR # your blue
-            text_color = "#fff"
+def _prob_pill_colors(probability: float) -> Tuple[str, str]:
+    """Return (background, text) colours for a probability pill."""
+    if   probability >= 0.7:
+        return "#2ecc71", "#000"      # green
+    elif probability >= 0.4:
+        return "#f1c40f", "#000"      # yellow
+    return ACCENT_COLOR, "#fff"       # your blue
 
-        # inline style for the “pill”
-        prob_lbl.setStyleSheet(f"""
-            background: {pill_bg};
-            color: {text_color};
-            border-radius: 6px;
-            padding: 2px 8px;
-            min-width: 32px;
-        """)
 
-        lay.addWidget(prob_lbl, alignment=Qt.AlignHCenter)
+def movie_list_html(movies: List[str], trailer_lookup: dict[str, str]) -> str:
+    """
+    Render the picked movies as one rich-text document: a linked title
+    plus a probability pill per row. One QTextBrowser paints the whole
+    list instead of a widget tree per movie.
+    """
+    parts = []
+    for title in movies:
+        url      = trailer_lookup.get(title, "") or ""
+        prob     = movie_probability(title)
+        bg, fg   = _prob_pill_colors(prob)
+        parts.append(
+            f'<p style="font-weight:600; font-size:13pt;"><a href="{html.escape(url, quote=True)}">'
+            f'{html.escape(title)}</a>&nbsp;&nbsp;'
+            f'<span style="background:{bg}; color:{fg};">&nbsp;{prob:.2f}&nbsp;</span></p>'
+        )
+    return "".join(parts)
 
+class _AutoUpdateSignals(QObject):
+    finished = Signal()
+    failed   = Signal(str)
+
+
+class _AutoUpdateJob(QRunnable):
+    """Runs autoUpdate.main() on a pool thread and reports back via signals."""
+    def __init__(self) -> None:
+        super().__init__()
+        self.signals = _AutoUpdateSignals()
+
+    def run(self) -> None:
+        try:
+            # imported here: autoUpdate needs the API keys at import time and
+            # starts its log thread, which only the Update action should pay for
+            from autoUpdate import main as autoupdate_main
+            autoupdate_main()
+        except BaseException as exc:            # incl. SystemExit from main()
+            log_debug(f"[UPDATE] autoUpdate failed: {exc!r}")
+            self.signals.failed.emit(str(exc) or exc.__class__.__name__)
+        else:
+            self.signals.finished.emit()
 
-        lay.addStretch()
 
-        # drop-shadow effect
-        self._shadow = QGraphicsDropShadowEffect(self)
-        self._shadow.setBlurRadius(4)
-        self._shadow.setColor(QColor(0, 0, 0, 100))
-        self._shadow.setOffset(0, 0)
-        self.setGraphicsEffect(self._shadow)
-        
-    def enterEvent(self, event):
-        super().enterEvent(event)
-        anim = QPropertyAnimation(self._shadow, b"blurRadius", self)
-        anim.setDuration(200)
-        anim.setEndValue(16)
-        anim.start(QPropertyAnimation.DeleteWhenStopped)
-
-    def leaveEvent(self, event):
-        super().leaveEvent(event)
-        anim = QPropertyAnimation(self._shadow, b"blurRadius", self)
-        anim.setDuration(200)
-        anim.setEndValue(4)
-        anim.start(QPropertyAnimation.DeleteWhenStopped)
-        
 class ReportDialog(QDialog):
     """Checkbox list of movies to mark as ‘bad trailer’."""
 
@@ -460,19 +581,10 @@ class PickerPage(QWidget):
         control_layout.addStretch()          # push stats (and controls) upward
         outer.addLayout(control_layout)
         
-        # centre: scrollable movie grid
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-
-        # container for cards
-        self.movie_grid_frame = QWidget()
-        self.movie_grid_frame.setObjectName("MovieCardContainer")
-        self.movie_grid_layout = QGridLayout(self.movie_grid_frame)
-        self.movie_grid_layout.setContentsMargins(12, 12, 12, 12)
-        self.movie_grid_layout.setSpacing(12)
-
-        self.scroll_area.setWidget(self.movie_grid_frame)
-        outer.addWidget(self.scroll_area, 2)
+        # centre: one rich-text browser holds the whole movie list
+        self.movie_browser = QTextBrowser(objectName="MovieListBrowser")
+        self.movie_browser.setOpenLinks(False)
+        outer.addWidget(self.movie_browser, 2)
 
 
         # right: stats & direction
@@ -510,6 +622,7 @@ class PickerPage(QWidget):
         self.generate_button.clicked.connect(self.main_window.generate_movies)
         self.update_urls_button.clicked.connect(self.main_window.update_urls)
         self.report_button.clicked.connect(self._open_report_dialog)
+        self.movie_browser.anchorClicked.connect(QDesktopServices.openUrl)
 
         # pressing Enter in either LineEdit triggers generate
         self.attendee_input.returnPressed.connect(self.main_window.generate_movies)
@@ -517,33 +630,9 @@ class PickerPage(QWidget):
 
     # ───────────── public API ─────────────
     def display_movies(self, movies: List[str], trailer_lookup: dict[str, str]) -> None:
-        # clear old cards
-        while self.movie_grid_layout.count():
-            item = self.movie_grid_layout.takeAt(0)
-            if widget := item.widget():
-                widget.deleteLater()
         self.current_movies = movies
         self.current_lookup = trailer_lookup
-        
-        # determine card width (including spacing)
-        card_width = 200                
-        margins    = self.movie_grid_layout.contentsMargins()
-        spacing    = self.movie_grid_layout.horizontalSpacing()
-
-        # fetch the inner viewport width of the scroll area
-        available_width = self.scroll_area.viewport().width() \
-                        - margins.left() - margins.right()
-                        
-        # compute number of columns, at least 1
-        cols = max(1, (available_width + spacing) // (card_width + spacing))
-
-        # add a MovieCard for each movie
-        for idx, title in enumerate(movies):
-            url        = trailer_lookup.get(title, "")
-            prob       = movie_probability(title)
-            card       = MovieCard(title, url, prob, self)
-            row, col   = divmod(idx, cols)
-            self.movie_grid_layout.addWidget(card, row, col)
+        self.movie_browser.setHtml(movie_list_html(movies, trailer_lookup))
 
         # random direction + number
         # inside PickerPage.display_movies or wherever you pick direction/number
@@ -597,9 +686,15 @@ class PickerPage(QWidget):
     def _open_report_dialog(self) -> None:
         dialog = ReportDialog(self, self.current_movies)
         if dialog.exec() == QDialog.Accepted:
-            for title in dialog.selected_movies():
-                report_trailer(title, self.current_lookup.get(title, ""))
-            QMessageBox.information(self, "Reported", "Thanks for the feedback!")
+            selected = dialog.selected_movies()
+            if not selected:
+                return
+            report_trailers({title: self.current_lookup.get(title, "") for title in selected})
+            QMessageBox.information(
+                self,
+                "Reported",
+                "Marked for manual review:\n" + "\n".join(f"• {t}" for t in selected),
+            )
 
 
 class StatsPage(QWidget):
@@ -654,10 +749,35 @@ class MainWindow(QMainWindow):
         reroll_action.triggered.connect(self.generate_movies)
         toolbar.addAction(reroll_action)
 
+        self._update_job: Optional[_AutoUpdateJob] = None   # running autoUpdate, if any
+
     # ─────────────────── public slots ───────────────────
     @Slot()
     def update_urls(self) -> None:
-        subprocess.run(["python", AUTO_UPDATE_SCRIPT], check=False)
+        # run autoUpdate in-process on a pool thread: no interpreter fork and
+        # the UI stays live; one run at a time, button disabled meanwhile
+        if self._update_job is not None:
+            return
+        job = _AutoUpdateJob()
+        job.signals.finished.connect(self._on_update_finished)
+        job.signals.failed.connect(self._on_update_failed)
+        self._update_job = job
+        self.picker_page.update_urls_button.setEnabled(False)
+        QThreadPool.globalInstance().start(job)
+
+    def _update_done(self) -> None:
+        self._update_job = None
+        self.picker_page.update_urls_button.setEnabled(True)
+
+    @Slot()
+    def _on_update_finished(self) -> None:
+        self._update_done()
+        QMessageBox.information(self, "Update URLs", "Trailer URLs updated.")
+
+    @Slot(str)
+    def _on_update_failed(self, error: str) -> None:
+        self._update_done()
+        QMessageBox.warning(self, "Update URLs", f"Update failed:\n{error}")
 
     @Slot()
     def generate_movies(self) -> None:
@@ -678,35 +798,33 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "Run Update URLs first.")
             return
 
-        workbook = openpyxl.load_workbook(GHIBLI_SHEET_PATH, read_only=True)
-        sheet_map = {normalize(name): name for name in workbook.sheetnames}
+        # keyed on mtime so repeat clicks skip the xlsx until Update URLs rewrites it
+        mtime_ns = GHIBLI_SHEET_PATH.stat().st_mtime_ns
+        sheet_map, sheet_keys = _sheet_index(GHIBLI_SHEET_PATH, mtime_ns)
         chosen_sheet = (
             sheet_map.get(normalize(sheet_name_raw))
-            or sheet_map.get(fuzzy_match(normalize(sheet_name_raw), list(sheet_map)))
+            or sheet_map.get(fuzzy_match(normalize(sheet_name_raw), sheet_keys))
         )
         if not chosen_sheet:
             QMessageBox.warning(self, "Error", "Sheet not found.")
             return
 
-        movie_titles = [
-            row[0] for row in workbook[chosen_sheet].iter_rows(min_row=1, max_col=1, values_only=True)
-            if row[0]
-        ]
+        movie_titles = _sheet_titles(GHIBLI_SHEET_PATH, mtime_ns, chosen_sheet)
         if attendee_count + 1 > len(movie_titles):
             QMessageBox.warning(self, "Error", "Not enough movies.")
             return
 
         chosen_movies = random.sample(movie_titles, attendee_count + 1)
-        trailer_lookup = {
-            title: locate_trailer(chosen_sheet, title)[0] for title in chosen_movies
-        }
-
-        # optional: build YouTube playlist from found trailers
-        video_ids = [
-            url.split("v=")[-1].split("&")[0]
-            for url in trailer_lookup.values()
-            if url and "watch?v=" in url
-        ]
+        # resolve trailers concurrently so YouTube fallbacks overlap instead
+        # of queueing; map() keeps the results in pick order
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            urls = list(pool.map(lambda t: locate_trailer(chosen_sheet, t)[0], chosen_movies))
+        trailer_lookup: dict[str, Optional[str]] = {}
+        video_ids: List[str] = []
+        for title, url in zip(chosen_movies, urls):
+            trailer_lookup[title] = url
+            if url and (m := _YT_ID_RE.search(url)):
+                video_ids.append(m.group(1))
         if video_ids:
             ids_csv = ",".join(video_ids)
             title   = urllib.parse.quote_plus(f"Movie Night {datetime.date.today()}")
@@ -746,11 +864,6 @@ def main() -> None:
     app.setStyleSheet("""
     /* ---- base typography ---- */
     QWidget            { font-family:"Inter","Roboto","Arial"; font-size:12pt; }
-    QLabel.MovieTitle  { font-weight:600; font-size:13pt; }
-
-    /* ---- movie-row hover ---- */
-    QWidget#MovieRow:hover        { background:#303030; }
-    QWidget#MovieRow:hover a      { text-decoration:underline; }
 
     /* ---- rounded tile gradient ---- */
     QLabel#DirectionTile, QLabel#NumberTile {
@@ -759,12 +872,6 @@ def main() -> None:
         border-radius        :10px;
     }
     
-    /* base styling for each MovieCard */
-    QFrame#MovieCardItem {
-        background: #2b2c2e;
-        border-radius: 8px;}
-    /*Hover Movie Card*/    
-    QFrame#MovieCardItem:hover {background-color: #303030;}
 
     /* ---- flat buttons (auto-raise look) ---- */
     QPushButton          { background:transparent; border:1px solid #555; padding:3px 10px; }
@@ -779,13 +886,11 @@ def main() -> None:
     /* ---- splitter handle invisible ---- */
     QSplitter::handle    { background:transparent; }
     
-    QWidget#MovieCardContainer {
+    QTextBrowser#MovieListBrowser {
         background: #272727;
         border-radius: 12px;
+        padding: 12px;
     }
-
-    /* individual card hover cursor */
-    QFrame#MovieCardItem { cursor: pointer;}
     
     /* ─── stats card styling ──────*/
     QFrame#StatsCard {
@@ -1,11 +1,11 @@
 from __future__ import annotations
-import datetime, random, urllib.parse
+import datetime, random, re, threading, urllib.parse
 from typing  import Dict, List, Tuple, Optional
 
 from PySide6.QtCore import QObject, QThread
 
 from movieNight.settings          import GHIBLI_SHEET_PATH, SPREADSHEET_ID
-from movieNight.utils             import locate_trailer, log_debug, open_url_host_browser
+from movieNight.utils             import clear_trailer_memo, locate_trailer, log_debug, open_url_host_browser
 from movieNight.metadata import repo
 from movieNight.movie_api.scrapers import IMDbScraper
 from movieNight.metadata.analytics.update_service import enrich_movie, update_scores_and_trends   
@@ -15,6 +15,9 @@ from movieNight.gui.workers import _MetaWorker, _CollectWorker, _URLWorker
 # type alias for what we return to the GUI
 GenerateResult = Tuple[List[str], Dict[str, str | None]]
 
+# 11-char video id from watch?v=… / &v=… links and youtu.be/… shortlinks
+_YT_ID_RE = re.compile(r"(?:youtu\.be/|[?&]v=)([\w-]{11})")
+
 def generate_movies(sheet_name_input: str, attendee_count: int) -> GenerateResult:
     """
     Randomly choose *(attendee_count + 1)* movies linked to the given
@@ -42,19 +45,11 @@ def generate_movies(sheet_name_input: str, attendee_count: int) -> GenerateResul
         raise ValueError("Sheet name?")
 
     # ── candidate pool from DB ──────────────────────────────────────
-    movie_ids = repo.ids_for_sheet(sheet)
-    if not movie_ids:
+    # one JOIN for (title, link) of every movie on the tab with a trailer
+    pool = repo.pool_for_sheet(sheet)
+    if not pool and not repo.ids_for_sheet(sheet):
         raise ValueError("Sheet not found.")
 
-    # fetch (mid, title, link) once – avoids per-movie queries later
-    rows = [
-        (mid,
-         (m := repo.by_id(mid)).title,
-         m.youtube_link)
-        for mid in movie_ids
-    ]
-    pool = [(t, link) for _id, t, link in rows if link]   # keep only with trailer
-
     if attendee_count + 1 > len(pool):
         raise ValueError("Not enough movies on that sheet with trailers.")
 
@@ -64,7 +59,7 @@ def generate_movies(sheet_name_input: str, attendee_count: int) -> GenerateResul
     trailer_map: Dict[str, str] = {t: link for t, link in chosen}
 
     # ── open YT playlist in host browser ────────────────────────────
-    video_ids = [link.split("v=")[-1].split("&")[0] for link in trailer_map.values()]
+    video_ids = _YT_ID_RE.findall(" ".join(trailer_map.values()))
     if video_ids:
         playlist = (
             "https://www.youtube.com/watch_videos"
@@ -72,7 +67,8 @@ def generate_movies(sheet_name_input: str, attendee_count: int) -> GenerateResul
             f"&title={urllib.parse.quote_plus(f'Movie Night {datetime.date.today()}')}"
             "&feature=share"
         )
-        open_url_host_browser(playlist)
+        # spawning the browser can block; don't hold up the caller (GUI thread)
+        threading.Thread(target=open_url_host_browser, args=(playlist,), daemon=True).start()
 
     return chosen_titles, trailer_map
 
@@ -85,40 +81,53 @@ def add_remove_movie(current: list[str], pool: list[str], delta: int) -> list[st
     """
     lst = current.copy()
     if delta > 0:
-        choice = random.choice([t for t in pool if t not in lst])
+        taken = set(lst)
+        choice = None
+        # sparse list: rejection-sample from pool (O(1) expected, no copy)
+        if len(taken) * 2 < len(pool):
+            for _ in range(32):
+                c = random.choice(pool)
+                if c not in taken:
+                    choice = c
+                    break
+        if choice is None:                       # dense list / unlucky draws
+            choice = random.choice([t for t in pool if t not in taken])
         lst.append(choice)
     elif len(lst) > 1:
         lst.pop(random.randrange(len(lst)))
     return lst
 #This is also called
 def update_data() -> None:
+    sheets_xlsx.close_workbook()               # release the file before overwriting it
     sheets_xlsx.download_spreadsheet_as_xlsx(SPREADSHEET_ID, GHIBLI_SHEET_PATH)
     touched: set[int] = set()
+    scraper = IMDbScraper()        # one session for every tab
 
     for tab in sheets_xlsx.get_non_green_tabs(SPREADSHEET_ID):
         theme_id = repo.ensure_spreadsheet_theme(tab)
         titles   = sheets_xlsx.get_movie_titles_from_sheet(GHIBLI_SHEET_PATH, tab)
 
         present  = repo.titles_to_ids(titles)
-        new_rows = [{"title": t} for t in titles if t not in present]
+        new_rows = [{"title": t} for t in dict.fromkeys(titles) if t not in present]
         new_ids  = repo.bulk_insert_movies(new_rows)
-        present.update({r["title"]: mid for r, mid in zip(new_rows, new_ids)})
+        present.update(zip((r["title"] for r in new_rows), new_ids))
         repo.link_movies_to_spreadsheet_theme(list(present.values()), theme_id)
 
-        scraper = IMDbScraper(min_delay=1.5)   # once per tab
+        links: Dict[int, str] = {}             # trailer writes, flushed per tab
         for title, mid in present.items():
             # full enrichment + recalc
-            enrich_movie(mid, scraper)
-            update_scores_and_trends(mid)
+            movie = enrich_movie(mid, scraper)
+            movie = update_scores_and_trends(mid, movie)
 
-            movie = repo.by_id(mid)
             if not movie.youtube_link:
                 url, *_ = locate_trailer(title)
                 if url:
-                    repo.update_youtube_link(mid, url)
+                    links[mid] = url
 
             touched.add(mid)
+        repo.update_youtube_links(links)
 
+    clear_trailer_memo()                       # next run sees the new DB links
     log_debug(f"Update data complete ({len(touched)} movies refreshed).")
 
       
@@ -171,7 +180,7 @@ def update_trailer_urls() -> None:
         log_debug("update_trailer_urls: no missing‐trailer movies found.")
         return
 
-    updated_count = 0
+    links: Dict[int, str] = {}
     for row in rows:
         mid = row["id"]
         title = row["title"]
@@ -179,8 +188,9 @@ def update_trailer_urls() -> None:
         # Attempt to find a trailer (TMDb → youtube‐dl → YouTube search, etc.)
         url, *_ = locate_trailer(title)
         if url:
-            repo.update_youtube_link(mid, url)
-            updated_count += 1
-            log_debug(f"update_trailer_urls: wrote trailer for “{title}” (id={mid})")
+            links[mid] = url
+            log_debug(f"update_trailer_urls: found trailer for “{title}” (id={mid})")
 
+    repo.update_youtube_links(links)               # one transaction
+    updated_count = len(links)
     log_debug(f"update_trailer_urls: finished. {updated_count} / {len(rows)} URLs added.")
\ No newline at end of file
@@ -1,11 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from PySide6.QtCore import QObject, Signal, Slot
 
+from movieNight.settings import MAX_CONCURRENT_JOBS
 from movieNight.metadata.api_clients import omdb_client, tmdb_client
 from movieNight.movie_api.scrapers import IMDbScraper
-from movieNight.utils import locate_trailer, log_debug
+from movieNight.utils import clear_trailer_memo, locate_trailer, log_debug
 from movieNight.metadata.core.repo import MovieRepo as repo
 from movieNight.metadata.analytics.update_service import enrich_movie, update_scores_and_trends
 
+PAGE_PREFETCH       = 4     # TMDb discover pages requested at once per country
+LINK_BATCH          = 50    # trailer links buffered per write transaction
+# TMDb cannot OR filters: "rated >= 5" and "no votes yet" are two discover queries
+DISCOVER_FILTERS    = ({"vote_average_gte": 5}, {"vote_count_lte": 0})
+
+# ───────────────────────── shared helpers ─────────────────────────────────
+def _run_bounded(items, job, on_done, limit: int = MAX_CONCURRENT_JOBS) -> None:
+    """
+    Run blocking *job(item)* for every item, at most *limit* at a time, on
+    a small thread pool; each job borrows a pooled SQLite connection while
+    it runs. *on_done(item, result)* runs back on the calling (worker)
+    thread as jobs finish, so it may emit signals and write resume points.
+    The first exception cancels the jobs that have not started and is
+    re-raised.
+    """
+    def pooled(item):
+        with repo.read_conn():
+            return job(item)
+
+    with ThreadPoolExecutor(max_workers=limit) as pool:
+        futures = {pool.submit(pooled, item): item for item in items}
+        try:
+            for fut in as_completed(futures):
+                on_done(futures[fut], fut.result())
+        except BaseException:
+            pool.shutdown(cancel_futures=True)
+            raise
+
+
+def _resume_marker(key: str, ids: list[int]):
+    """
+    Jobs finish out of order, so the kv resume point only advances to the
+    highest id whose predecessors in *ids* have all finished.
+    """
+    done: set[int] = set()
+    pos = 0
+
+    def mark(*mids: int) -> None:
+        nonlocal pos
+        done.update(mids)
+        last = None
+        while pos < len(ids) and ids[pos] in done:
+            last = ids[pos]
+            done.discard(last)
+            pos += 1
+        if last is not None:
+            repo.set_kv(key, str(last))
+    return mark
+
 # ───────────────────────── Worker skeletons ───────────────────────────────
 class _MetaWorker(QObject):
     progress  = Signal(int, int)
@@ -15,11 +67,10 @@ class _MetaWorker(QObject):
     def __init__(self, full: bool):
         super().__init__()
         self.full = full
-        self.scraper = IMDbScraper(min_delay=1.5)
+        self.scraper = IMDbScraper()
 
     @Slot()
     def run(self):
-        repo.attach_thread()
         try:
             self._run()
             self.finished.emit(True)
@@ -30,19 +81,28 @@ class _MetaWorker(QObject):
     # actual job
     def _run(self):
         # load last resume point (None == full run)
-        last_kv = repo.get_kv("meta_resume")
-        last    = int(last_kv) if last_kv and not self.full else None
-        ids   = repo.movie_ids_sorted(resume_after=last)
-        total = len(ids)
+        with repo.read_conn():
+            last_kv = repo.get_kv("meta_resume")
+            last    = int(last_kv) if last_kv and not self.full else None
+            rows    = list(repo.movies_sorted(resume_after=last))   # (id, title)
+        total = len(rows)
+        mark  = _resume_marker("meta_resume", [mid for mid, _ in rows])
+        count = 0
 
         self.progress.emit(0, total)                          # show busy bar
 
-        for i, mid in enumerate(ids, start=1):
-            self.message.emit(repo.by_id(mid).title)
-            enrich_movie(mid, self.scraper)                   # single API sweep
-            repo.set_kv("meta_resume", str(mid))
-            self.progress.emit(i, total)
+        def job(row):
+            enrich_movie(row[0], self.scraper)                # single API sweep
 
+        def on_done(row, _):
+            nonlocal count
+            mid, title = row
+            count += 1
+            self.message.emit(title)
+            mark(mid)
+            self.progress.emit(count, total)
+
+        _run_bounded(rows, job, on_done)
         repo.set_kv("meta_resume", "0")                   # clear resume
 
 
@@ -58,7 +118,6 @@ class _URLWorker(QObject):
 
     @Slot()
     def run(self):
-        repo.attach_thread()
         try:
             self._run()
             self.finished.emit(True)
@@ -67,23 +126,39 @@ class _URLWorker(QObject):
             self.finished.emit(False)
 
     def _run(self):
+        clear_trailer_memo()                         # retry earlier misses
         # load last resume point (None == full run)
-        last_kv = repo.get_kv("url_resume")
-        last    = int(last_kv) if last_kv and not self.full else None
-        rows = repo.movies_missing_trailer(resume_after=last)
+        with repo.read_conn():
+            last_kv = repo.get_kv("url_resume")
+            last    = int(last_kv) if last_kv and not self.full else None
+            rows    = repo.movies_missing_trailer(resume_after=last)
         total = len(rows)
-
-        for i, row in enumerate(rows, start=1):
-            mid, title = row["id"], row["title"]
-            self.message.emit(title)
-
-            url, *_ = locate_trailer(title)              # one lookup per movie
-            if url:
-                repo.update_youtube_link(mid, url)
-
-            repo.set_kv("url_resume", str(mid))
-            self.progress.emit(i, total)
-
+        mark  = _resume_marker("url_resume", [row["id"] for row in rows])
+        count = 0
+
+        pending: list[tuple[int, str | None]] = []   # (id, url) not yet written
+
+        def flush():
+            # links first, then the resume point, so a crash never skips rows
+            repo.update_youtube_links({mid: url for mid, url in pending if url})
+            mark(*(mid for mid, _ in pending))
+            pending.clear()
+
+        def job(row):
+            url, *_ = locate_trailer(row["title"])       # one lookup per movie
+            return url
+
+        def on_done(row, url):
+            nonlocal count
+            count += 1
+            self.message.emit(row["title"])
+            pending.append((row["id"], url))
+            if len(pending) >= LINK_BATCH:
+                flush()
+            self.progress.emit(count, total)
+
+        _run_bounded(rows, job, on_done)
+        flush()
         repo.set_kv("url_resume", "0")               # clear when finished
 
 class _CollectWorker(QObject):
@@ -97,15 +172,72 @@ class _CollectWorker(QObject):
 
     def __init__(self):
         super().__init__()
-        self.tmdb    = tmdb_client.TMDBClient()
-        self.omdb    = omdb_client.OMDBClient()
-        self.scraper = IMDbScraper(min_delay=1.5)
+        self.tmdb    = tmdb_client              # shared, already-configured clients
+        self.omdb    = omdb_client
+        self.scraper = IMDbScraper()
+
+    # one discovered movie: upsert, enrich, trailer (runs on a pool thread)
+    def _collect_one(self, m: dict) -> None:
+        tmdb_id = m["id"]
+        title   = m.get("title") or m.get("name") or "<untitled>"
+
+        # upsert by tmdb_id
+        mid = repo.id_by_tmdb(tmdb_id)
+        if not mid:
+            mid = repo.add_movie({
+                "title":   title,
+                "tmdb_id": tmdb_id,
+                "year":    (m.get("release_date") or "")[:4] or None,
+            })
+
+        # full metadata sweep
+        movie = enrich_movie(mid, self.scraper)
+        movie = update_scores_and_trends(mid, movie)
+
+        # trailer only if missing
+        if not movie.youtube_link:
+            url, *_ = locate_trailer(title)
+            if url:
+                repo.update_youtube_link(mid, url)
+
+    def _discover_page(self, country: str, filters: dict, page: int) -> tuple[list[dict], int]:
+        """
+        One discover page. 429s are retried with back-off inside
+        TMDBClient._get; if they persist, RateLimitReached fails the run
+        rather than passing for the end of the results.
+        """
+        return self.tmdb.discover_movies(country=country, page=page, **filters)
+
+    def _pages(self, country: str):
+        """
+        Yield *country*'s discover pages in order, one query per
+        DISCOVER_FILTERS entry. Page 1 gives total_pages; the rest are
+        requested PAGE_PREFETCH at a time.
+        """
+        with ThreadPoolExecutor(max_workers=PAGE_PREFETCH) as pool:
+            for filters in DISCOVER_FILTERS:
+                movies, total = self._discover_page(country, filters, 1)
+                yield movies
+                for start in range(2, total + 1, PAGE_PREFETCH):
+                    batch = [
+                        pool.submit(self._discover_page, country, filters, p)
+                        for p in range(start, min(start + PAGE_PREFETCH, total + 1))
+                    ]
+                    for fut in batch:
+                        yield fut.result()[0]
 
     @Slot()
     def run(self):
-        # ensure thread uses its own SQLite connection
-        repo.attach_thread()
+        try:
+            self._run()
+            self.finished.emit(True)
+        except Exception as e:
+            log_debug(f"collect-worker error: {e}")
+            self.finished.emit(False)
 
+    def _run(self):
+        clear_trailer_memo()                         # retry earlier misses
+        # DB work happens in _collect_one on pool threads (pooled connections)
         # 1) fetch all supported country codes from TMDb
         countries = [c["iso_3166_1"] for c in self.tmdb.get_countries()]
 
@@ -115,50 +247,20 @@ class _CollectWorker(QObject):
         # tell UI we’re busy (unknown total)
         self.progress.emit(0, 0)
 
-        for country in countries:
-            page = 1
-            while True:
-                movies = self.tmdb.discover_movies(
-                    region=country,
-                    vote_average_gte=5,
-                    include_null_votes=True,
-                    page=page
-                )
-                if not movies:
-                    break
+        def on_done(m, _):
+            nonlocal total_processed
+            total_processed += 1
+            self.message.emit(f"{country} → {m.get('title') or m.get('name') or '<untitled>'}")
+            self.progress.emit(total_processed, 0)
 
+        for country in countries:
+            for movies in self._pages(country):
+                fresh = []
                 for m in movies:
                     tmdb_id = m.get("id")
                     if not tmdb_id or tmdb_id in seen_tmdb_ids:
                         continue
                     seen_tmdb_ids.add(tmdb_id)
+                    fresh.append(m)
 
-                    title = m.get("title") or m.get("name") or "<untitled>"
-                    self.message.emit(f"{country} → {title}")
-
-                    # upsert by tmdb_id
-                    mid = repo.id_by_tmdb(tmdb_id)
-                    if not mid:
-                        mid = repo.add_movie({
-                            "title":   title,
-                            "tmdb_id": tmdb_id,
-                            "year":    (m.get("release_date") or "")[:4] or None,
-                        })
-
-                    # full metadata sweep
-                    enrich_movie(mid, self.scraper)
-                    update_scores_and_trends(mid)
-
-                    # trailer only if missing
-                    movie = repo.by_id(mid)
-                    if not movie.youtube_link:
-                        url, *_ = locate_trailer(title)
-                        if url:
-                            repo.update_youtube_link(mid, url)
-
-                    total_processed += 1
-                    self.progress.emit(total_processed, 0)
-
-                page += 1
-
-        self.finished.emit(True)
\ No newline at end of file
+                _run_bounded(fresh, self._collect_one, on_done)
@@ -2,11 +2,12 @@
 from __future__ import annotations
 from typing import Any, Dict, Optional
 
+from movieNight.metadata.core.models import Movie
 from movieNight.metadata.analytics.scoring import calculate_combined_score, calculate_actor_trend_score
-from movieNight.utils import locate_trailer
+from movieNight.utils import locate_trailer, log_debug
 from movieNight.metadata import (
     repo, tmdb_client, omdb_client, trend_client, trend_client)
-from movieNight.metadata.api_clients.errors import rate_limit_reached #Not defined yet
+from movieNight.metadata.api_clients.errors import RateLimitReached
 from movieNight.metadata.analytics.fairness import (
     Baselines, gtrend_fair, actor_trend_fair, combined_score_fair)
 from movieNight.metadata.identity.fingerprint import same_movie, _NORMALIZERS
@@ -22,8 +23,9 @@ INTERNET_PEN = repo.internet_penetration_by_country()   # {ISO: 0‥1}
 # 1 ▸ combined-score recomputation for ONE movie-id
 # ───────────────────────────────────────────────────────────────────────────
 # ───────────────────────── 1 ▸ combined score  ──────────────────────
-def recalc_combined_fair(movie_id: int) -> None:
-    movie = repo.by_id(movie_id)
+def recalc_combined_fair(movie_id: int, movie: Movie | None = None) -> float:
+    """Recompute + store the fair combined score; returns the new value."""
+    movie = movie or repo.by_id(movie_id)
     r = repo.current_ratings_dict(movie_id)   # {'IMDB': (78,1234), …}
 
     # build {src: (score, n)} even if you only have ONE column / src
@@ -35,6 +37,7 @@ def recalc_combined_fair(movie_id: int) -> None:
     }
     new_score = combined_score_fair(movie, ratings, BASE)
     repo.update_movie_field(movie_id, "combined_score", new_score)
+    return new_score
 
 # keep alias for old name
 recalculate_combined_score = recalc_combined_fair
@@ -43,13 +46,23 @@ recalculate_combined_score = recalc_combined_fair
 # ───────────────────────────────────────────────────────────────────────────
 # 2 ▸ full refresh of ratings + trends for ONE movie-id
 # ───────────────────────────────────────────────────────────────────────────
-def update_scores_and_trends(movie_id: int) -> None:
-    """Refresh ratings + FAIR trend / combined score for one movie."""
-    m      = repo.by_id(movie_id)
+def update_scores_and_trends(movie_id: int, movie: Movie | None = None) -> Movie:
+    """
+    Refresh ratings + FAIR trend / combined score for one movie.
+
+    Pass the current *movie* row to skip the initial lookup; the same
+    object is returned with the fields written here updated in place.
+    """
+    m      = movie or repo.by_id(movie_id)
     title  = m.title
 
     # 2.1  ⎯ ratings─────────────────────────────────────
-    if (t := tmdb_client.fetch_user_rating(title)):
+    try:
+        t = tmdb_client.fetch_user_rating(title)
+    except RateLimitReached:
+        log_debug(f"update_scores_and_trends: TMDb rate-limited, rating skipped for “{title}”")
+        t = None
+    if t:
         repo.upsert_rating(movie_id, "TMDB", t[0] * 10, t[1])
 
     if (om := omdb_client.get_ratings(title=title)):
@@ -62,6 +75,7 @@ def update_scores_and_trends(movie_id: int) -> None:
         if (gt := trend_client.fetch_7day_average(title)) is not None:
             fair_gt = gtrend_fair(gt, m.origin, BASE, INTERNET_PEN)
             repo.update_movie_field(movie_id, "google_trend_score", fair_gt)
+            m.google_trend_score = fair_gt
 
     # 2.3  ⎯ Actor Trend (fair) ──────────────────────────────────────
     if repo.is_movie_field_missing(movie_id, "actor_trend_score"):
@@ -73,9 +87,11 @@ def update_scores_and_trends(movie_id: int) -> None:
                 base     = BASE,
             )
             repo.update_movie_field(movie_id, "actor_trend_score", fair_ats)
+            m.actor_trend_score = fair_ats
 
     # 2.4  ⎯ Combined score ─────────────────────────────────────────
-    recalc_combined_fair(movie_id)
+    m.combined_score = recalc_combined_fair(movie_id, m)
+    return m
 
 # ───────────────────────────────────────────────────────────────────────────
 # 3 ▸ batch refresh for every movie missing a trend score
@@ -137,9 +153,10 @@ def omdb_to_columns(blob: Dict[str, Any]) -> Dict[str, Any]:
         col["plot_desc"] = plot
     return col
 
-def enrich_movie(movie_id: int, imdb_scraper=None) -> None:
+def enrich_movie(movie_id: int, imdb_scraper=None) -> Movie:
     """
-    Fill *missing* metadata fields for one movie row.
+    Fill *missing* metadata fields for one movie row and return the
+    refreshed `Movie`.
 
     Priority order
     --------------
@@ -154,25 +171,30 @@ def enrich_movie(movie_id: int, imdb_scraper=None) -> None:
     title    = m.title
 
     # ══════════ 1. TMDb ════════════════════════════════════════════════
+    mf: Dict[str, Any] = {}
     try:
         meta = tmdb_client.fetch_metadata(title)
     except RateLimitReached:
-        raise                          # bubble up so worker pauses
-    if meta:
-        mf: Dict[str, Any] = meta.get("movie_fields", {})
-        for col, val in mf.items():
-            if val and repo.is_movie_field_missing(movie_id, col):
-                repo.update_movie_field(movie_id, col, val)
-
-        for g in meta.get("genres", []):
-            repo.link_movie_genre(movie_id, g)
-            
-    # ── write tmdb_id and franchise first ─
-    if "tmdb_id" in mf and repo.is_movie_field_missing(movie_id, "tmdb_id"):
-        repo.update_movie_tmdb_id(movie_id, mf["tmdb_id"])
-
-    if "franchise" in mf and mf.get("franchise") and repo.is_movie_field_missing(movie_id, "franchise"):
-        repo.update_movie_franchise(movie_id, mf["franchise"])
+        # _get already backed off; skip TMDb for this movie, OMDb still runs
+        log_debug(f"enrich_movie: TMDb still rate-limited, skipping TMDb for “{title}”")
+        meta = None
+    # the TMDb fields land together or not at all (one writer transaction)
+    with repo.write_conn():
+        if meta:
+            mf = meta.get("movie_fields", {})
+            for col, val in mf.items():
+                if val and repo.is_movie_field_missing(movie_id, col):
+                    repo.update_movie_field(movie_id, col, val)
+
+            for g in meta.get("genres", []):
+                repo.link_movie_genre(movie_id, g)
+
+        # ── write tmdb_id and franchise first ─
+        if "tmdb_id" in mf and repo.is_movie_field_missing(movie_id, "tmdb_id"):
+            repo.update_movie_tmdb_id(movie_id, mf["tmdb_id"])
+
+        if "franchise" in mf and mf.get("franchise") and repo.is_movie_field_missing(movie_id, "franchise"):
+            repo.update_movie_franchise(movie_id, mf["franchise"])
 
     # ══════════ 2. OMDb fallback ═══════════════════════════════════════
     if repo.is_movie_field_missing(movie_id, "duration_seconds"):
@@ -223,4 +245,5 @@ def enrich_movie(movie_id: int, imdb_scraper=None) -> None:
         rt_audience = rdict.get("RT_AUDIENCE", 0),
         metacritic  = rdict.get("METACRITIC", 0),
     )
-    repo.update_movie_field(movie_id, "combined_score", score)
\ No newline at end of file
+    repo.update_movie_field(movie_id, "combined_score", score)
+    return repo.by_id(movie_id)
\ No newline at end of file
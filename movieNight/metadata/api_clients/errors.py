@@ -1,3 +1,6 @@
-def rate_limit_reached():
-    pass
-    
\ No newline at end of file
+class RateLimitReached(Exception):
+    """An API answered HTTP 429; *retry_after* is its suggested wait (s)."""
+
+    def __init__(self, retry_after: float = 1.0, message: str = "rate limit reached"):
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -1,10 +1,10 @@
 # movieNight/metadata/omdb_client.py
 from __future__ import annotations
 
-import os, re, functools, requests
+import os, re, functools
 from typing import Any, Dict, Optional, Tuple, List
 
-from movieNight.utils import log_debug, throttle
+from movieNight.utils import http_session, log_debug, throttle
 
 
 OMDB_URL = "http://www.omdbapi.com/" 
@@ -22,6 +22,7 @@ class OMDBClient:
         self.api_key = api_key or os.getenv("OMDB_API_KEY")
         if not self.api_key:
             raise RuntimeError("OMDB_API_KEY not set and no api_key passed")
+        self.session = http_session()
 
     # ────────────────────────────────────────────────────────────────
     # Internal – one cached JSON payload per movie
@@ -36,7 +37,7 @@ class OMDBClient:
         params["i" if imdb_id else "t"] = imdb_id or title
 
         try:
-            resp = requests.get(OMDB_URL, params=params, timeout=8)
+            resp = self.session.get(OMDB_URL, params=params, timeout=8)
             data = resp.json()
             if data.get("Response") == "True":
                 return data
@@ -1,20 +1,31 @@
 from __future__ import annotations
 
-import sys
+import json, random, time
 from typing import Optional, Any, List
 import datetime as _dt
 
 import requests
 
-from movieNight.utils import log_debug, normalize, throttle
-from movieNight.settings import TMDB_API_KEY
+from movieNight.utils import http_session, log_debug, normalize
+from movieNight.movie_api.rate_limits import TMDB_LIMITER
+from movieNight.metadata.api_clients.errors import RateLimitReached
+from movieNight.settings import TMDB_API_KEY, COUNTRIES_CACHE_PATH
 from movieNight.metadata.movie_night_db     import connection
 from movieNight.metadata import international_reference
 
+_COUNTRIES: list[dict] | None = None        # process-wide get_countries() memo
 
 class TMDBClient:
     """Thin wrapper around The Movie Database (TMDb) that persists to SQLite."""
     BASE_URL = "https://api.themoviedb.org/3"
+    COUNTRIES_TTL = 30 * 86400              # ISO-3166 list barely changes
+
+    # response-cache TTLs: static reference data for a week, discover
+    # listings for an hour, everything else (search / details) for a day
+    CACHE_TTL = {
+        "api.themoviedb.org/3/configuration/*": 7 * 86400,
+        "api.themoviedb.org/3/discover/*":      3600,
+    }
 
     # ------------------------------------------------------------------
     # Construction
@@ -24,11 +35,31 @@ class TMDBClient:
         self.api_key = api_key
         if not self.api_key:
                 raise RuntimeError("No TMDB apit key passed")
+        self.session = http_session(urls_expire_after=self.CACHE_TTL)
+
+    RATE_LIMIT_RETRIES = 4                  # 429 back-offs per request before giving up
 
-    @throttle(min_delay=0.4)                 # ≈ 2.5 req/sec
     def _get(self, path: str, **params):
+        """
+        GET *path*. On HTTP 429, back off ``Retry-After * 2**attempt`` (plus
+        jitter) and retry; after RATE_LIMIT_RETRIES raises `RateLimitReached`.
+        """
         params["api_key"] = self.api_key
-        return requests.get(f"{self.BASE_URL}{path}", params=params, timeout=10)
+        for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+            with TMDB_LIMITER:               # shared 40 req / 10 s budget
+                resp = self.session.get(f"{self.BASE_URL}{path}", params=params, timeout=10)
+            if getattr(resp, "from_cache", False):      # never hit TMDb
+                TMDB_LIMITER.refund()
+            if resp.status_code != 429:
+                return resp
+            try:
+                retry_after = float(resp.headers.get("Retry-After", 1))
+            except ValueError:
+                retry_after = 1.0
+            log_debug(f"TMDb 429 on {path} (attempt {attempt + 1}, retry after {retry_after}s)")
+            if attempt < self.RATE_LIMIT_RETRIES:
+                time.sleep(retry_after * 2 ** attempt + random.random())
+        raise RateLimitReached(retry_after)
     # ------------------------------------------------------------------
     # Public – High‑level helper
     # ------------------------------------------------------------------
@@ -52,13 +83,9 @@ class TMDBClient:
         movie_id = match["id"]
         log_debug(f"TMDb → matched ID={movie_id} for “{title}”")
 
-        details = requests.get(
-            f"{self.BASE_URL}/movie/{movie_id}",
-            params={
-                "api_key": self.api_key,
-                "append_to_response": "release_dates,videos",
-            },
-            timeout=10,
+        details = self._get(
+            f"/movie/{movie_id}",
+            append_to_response="release_dates,videos",
         ).json()
 
         # ── Release window / origin country ──────────────────────────
@@ -106,9 +133,6 @@ class TMDBClient:
                 query=title,
                 page=page
                 )
-            if r.status_code == 429:
-                log_debug("TMDb rate limit reached – exiting…")
-                sys.exit(1)
             payload = r.json()
             results = payload.get("results", [])
             all_results.extend(results)
@@ -193,10 +217,9 @@ class TMDBClient:
 
         movie_id = match["id"]
 
-        details = requests.get(
-            f"{self.BASE_URL}/movie/{movie_id}",
-            params={"api_key": self.api_key, "fields": "vote_average,vote_count"},
-            timeout=10,
+        details = self._get(
+            f"/movie/{movie_id}",
+            fields="vote_average,vote_count",
         ).json()
 
         # TMDb always includes these two keys (default 0, 0)
@@ -243,14 +266,64 @@ class TMDBClient:
                         return rd["certification"]
         return None
     
+    MAX_DISCOVER_PAGES = 500                # TMDb refuses page > 500
+
+    def discover_movies(
+        self,
+        country: str,
+        page: int = 1,
+        vote_average_gte: float | None = None,
+        vote_count_lte: int | None = None,
+    ) -> tuple[list[dict], int]:
+        """
+        One page of ``/discover/movie`` for movies originating in *country*.
+
+        Returns ``(movies, total_pages)``. The vote filters are applied by
+        TMDb; it cannot OR them, so callers wanting "rated >= X or unrated"
+        run one query per filter.
+        """
+        params: dict[str, Any] = {
+            "with_origin_country": country,
+            "page": page,
+            "sort_by": "popularity.desc",
+        }
+        if vote_average_gte is not None:
+            params["vote_average.gte"] = vote_average_gte
+        if vote_count_lte is not None:
+            params["vote_count.lte"] = vote_count_lte
+        resp = self._get("/discover/movie", **params)
+        resp.raise_for_status()
+        payload = resp.json()
+        total = min(payload.get("total_pages", 1), self.MAX_DISCOVER_PAGES)
+        return payload.get("results", []), total
+
     def get_countries(self) -> list[dict]:
         """
         Return the list of all TMDb-supported origin countries:
         [{ "iso_3166_1": "...", "english_name": "..." }, …]
+
+        Memoized for the process (`_COUNTRIES`) and kept on disk
+        (COUNTRIES_CACHE_PATH) for COUNTRIES_TTL, so repeat runs skip the
+        request entirely.
         """
-        resp = self._get("configuration/countries")   # your internal GET wrapper
+        global _COUNTRIES
+        if _COUNTRIES is not None:
+            return _COUNTRIES
+
+        path = COUNTRIES_CACHE_PATH
+        if path.exists() and time.time() - path.stat().st_mtime < self.COUNTRIES_TTL:
+            try:
+                _COUNTRIES = json.loads(path.read_bytes())
+                return _COUNTRIES
+            except ValueError:
+                log_debug("TMDb countries cache unreadable – refetching")
+
+        resp = self._get("/configuration/countries")   # your internal GET wrapper
         resp.raise_for_status()
-        return resp.json()    
+        _COUNTRIES = resp.json()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(_COUNTRIES), encoding="utf-8")
+        return _COUNTRIES
 
 import sqlite3
 from ...settings import DATABASE_PATH
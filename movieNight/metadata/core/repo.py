@@ -6,11 +6,13 @@ All SQL lives here; other layers import this module instead of touching
 """
 
 from __future__ import annotations
+import functools
 import sqlite3
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set
 from datetime import date
 
-from movieNight.metadata.movie_night_db import execute, executemany, commit, connection
+from movieNight.metadata.movie_night_db import (
+    execute, executemany, connection, read_conn, write_conn)
 from movieNight.metadata.core.models import Movie
 
 _ALLOWED_MOVIE_COLS: Set[str] = {
@@ -18,13 +20,32 @@ _ALLOWED_MOVIE_COLS: Set[str] = {
     "youtube_link", "box_office_expected", "box_office_actual",
     "combined_score", "franchise_id", "origin_iso2", "tmdb_id", "imdb_id","created_at", "updated_at"
 }
+_MAX_SQL_VARS = 900     # bound parameters per statement (SQLite default cap 999)
+
+
+def _writes(fn):
+    """Run a MovieRepo writer as one transaction on the pooled writer."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with write_conn():
+            return fn(*args, **kwargs)
+    return wrapper
 
 
 class MovieRepo:
     """High-level CRUD and query helpers for Movie objects."""
 
+    # ───────────────────────── pooled connections ───────────────────
+    # Worker threads wrap their reads in `with repo.read_conn():`. Every
+    # writer below is `@_writes`, so it runs on the single pooled writer
+    # whatever connection the calling thread holds; wrap several calls in
+    # `with repo.write_conn():` to make them one transaction.
+    read_conn  = staticmethod(read_conn)
+    write_conn = staticmethod(write_conn)
+
     # ───────────────────────────── writers ──────────────────────────
     @staticmethod
+    @_writes
     def add_user(name: str) -> int:
         """Insert a new *user* row (no duplicate names) and return its id.
 
@@ -36,6 +57,7 @@ class MovieRepo:
         return row["id"]
 
     @staticmethod
+    @_writes
     def add_movie(data: Dict[str, Any]) -> int:
         """Insert one row into **movies** and return the new row-id.
 
@@ -61,9 +83,9 @@ class MovieRepo:
 
         cur = execute(sql, tuple(data.values()))
         new_id = cur.lastrowid 
-        commit()
         return new_id
     @staticmethod
+    @_writes
     def add_rating(user_id: int, movie_id: int, rating: float) -> None:
         """Insert or update a *user → movie* rating (0-100 scale)."""
         execute(
@@ -71,9 +93,9 @@ class MovieRepo:
             " VALUES (?,?,?)",
             (user_id, movie_id, rating),
         )
-        commit()
 
     @staticmethod
+    @_writes
     def update_movie_field(movie_id: int, field: str, value: Any) -> None:
         """Update a single scalar column on **movies**.
 
@@ -82,7 +104,6 @@ class MovieRepo:
         if field not in _ALLOWED_MOVIE_COLS:
             raise ValueError(f"Illegal movie field: {field}")
         execute(f"UPDATE movies SET {field}=? WHERE id=?", (value, movie_id))
-        commit()
 
     # ───────────────────────────── look-ups ──────────────────────────
     @staticmethod
@@ -106,6 +127,18 @@ class MovieRepo:
         ).fetchall()
         return [r["movie_id"] for r in rows]
 
+    @staticmethod
+    def pool_for_sheet(sheet: str) -> List[tuple[str, str]]:
+        """(title, youtube_link) for every movie on a sheet *tab* that has a trailer."""
+        rows = execute(
+            "SELECT m.title, m.youtube_link FROM movies m "
+            "JOIN movie_spreadsheet_themes mst ON mst.movie_id = m.id "
+            "JOIN spreadsheet_themes st ON st.id = mst.spreadsheet_theme_id "
+            "WHERE st.name=? AND m.youtube_link IS NOT NULL AND m.youtube_link<>''",
+            (sheet.strip(),)
+        ).fetchall()
+        return [(r["title"], r["youtube_link"]) for r in rows]
+
     @staticmethod
     def id_by_title(title: str) -> Optional[int]:
         """Find movie id by main or alias title."""
@@ -143,22 +176,34 @@ class MovieRepo:
         return row["youtube_link"] if row else None
 
     @staticmethod
+    @_writes
     def update_youtube_link(movie_id: int, url: str | None) -> None:
         execute("UPDATE movies SET youtube_link=? WHERE id=?", (url, movie_id))
-        commit()
+
+    @staticmethod
+    @_writes
+    def update_youtube_links(links: Dict[int, str]) -> None:
+        """Write many {movie_id: url} trailer links in one transaction."""
+        if not links:
+            return
+        executemany(
+            "UPDATE movies SET youtube_link=? WHERE id=?",
+            [(url, mid) for mid, url in links.items()],
+        )
 
     # ─────────────────────── genre / theme helpers ────────────────────
     @staticmethod
+    @_writes
     def _ensure_genre(name: str) -> int:
         """Return genre-id, inserting a new row if needed."""
         row = execute("SELECT id FROM genres WHERE name=?", (name,)).fetchone()
         if row:
          return row["id"]
         cur = execute("INSERT INTO genres(name) VALUES(?)", (name,))
-        commit()
         return cur.lastrowid
 
     @staticmethod
+    @_writes
     def link_movie_genre(movie_id: int, genre_name: str) -> None:
         """Insert *(movie_id, genre_id)* into **movie_genres** if missing."""
         gid = MovieRepo._ensure_genre(genre_name)
@@ -166,10 +211,10 @@ class MovieRepo:
             "INSERT OR IGNORE INTO movie_genres VALUES (?,?)",
             (movie_id, gid),
         )
-        commit()
 
     # ─────────────────── spreadsheet-theme helpers ────────────────────
     @staticmethod
+    @_writes
     def _ensure_spreadsheet_theme(name: str) -> int:
         """Return theme-id for Google sheet tab, inserting if absent."""
         tid = execute(
@@ -178,7 +223,6 @@ class MovieRepo:
         if tid:
             return tid["id"]
         cur = execute("INSERT INTO spreadsheet_themes(name) VALUES(?)", (name,))
-        commit()
         return cur.lastrowid
     
     @staticmethod
@@ -190,6 +234,7 @@ class MovieRepo:
         return MovieRepo._ensure_spreadsheet_theme(name)
 
     @staticmethod
+    @_writes
     def link_movie_to_sheet_theme(movie_id: int, sheet: str) -> None:
         """Connect *movie_id* with a Google-sheet tab in link table."""
         tid = MovieRepo._ensure_spreadsheet_theme(sheet)
@@ -198,7 +243,6 @@ class MovieRepo:
             "(movie_id, spreadsheet_theme_id) VALUES (?,?)",
             (movie_id, tid),
         )
-        commit()
         
     @staticmethod
     def list_spreadsheet_themes() -> list[str]:
@@ -210,6 +254,7 @@ class MovieRepo:
 
     # ───────────────────────── aggregates / views ─────────────────────
     @staticmethod
+    @_writes
     def update_user_attendance_counts() -> None:
         """Recompute `users.attendance_count` from the `user_ratings` table."""
         execute(
@@ -217,7 +262,6 @@ class MovieRepo:
             "  SELECT COUNT(*) FROM user_ratings ur WHERE ur.user_id = users.id"
             ")"
         )
-        commit()
 
     @staticmethod
     def average_rating(movie_id: int) -> Optional[float]:
@@ -277,6 +321,7 @@ class MovieRepo:
         return val is None or (isinstance(val, str) and val.strip() == "")
         # ───────────────────────────── bulk helpers ──────────────────────────
     @staticmethod
+    @_writes
     def bulk_insert_movies(rows: List[Dict[str, Any]]) -> List[int]:
         """Insert many movie dicts at once. Returns list of new row-ids.
 
@@ -291,19 +336,25 @@ class MovieRepo:
 
         params = [tuple(r[c] for c in cols) for r in rows]
         executemany(sql, params)
-        commit()
+        last_id = execute("SELECT last_insert_rowid()").fetchone()[0]
 
-        first_id = execute("SELECT last_insert_rowid()").fetchone()[0] - len(rows) + 1
+        first_id = last_id - len(rows) + 1
         return list(range(first_id, first_id + len(rows)))
 
     @staticmethod
     def titles_to_ids(titles: List[str]) -> Dict[str, int]:
-        """Return {title: id} for every title that already exists."""
-        if not titles:
-            return {}
-        q = ",".join("?" * len(titles))
-        rows = execute(f"SELECT id, title FROM movies WHERE title IN ({q})", tuple(titles)).fetchall()
-        return {r["title"]: r["id"] for r in rows}
+        """Return {title: id} for every title that already exists.
+
+        Looked up in `IN (…)` chunks of `_MAX_SQL_VARS` so large sheets stay
+        under SQLITE_MAX_VARIABLE_NUMBER (999 on older builds).
+        """
+        found: Dict[str, int] = {}
+        for i in range(0, len(titles), _MAX_SQL_VARS):
+            chunk = tuple(titles[i:i + _MAX_SQL_VARS])
+            q = ",".join("?" * len(chunk))
+            rows = execute(f"SELECT id, title FROM movies WHERE title IN ({q})", chunk).fetchall()
+            found.update((r["title"], r["id"]) for r in rows)
+        return found
     
     # ───────────────────────── kv  (resume points etc.) ───────────────────
     @staticmethod
@@ -312,24 +363,23 @@ class MovieRepo:
         return row["value"] if row else None
 
     @staticmethod
+    @_writes
     def set_kv(key: str, value: str) -> None:
         execute(
             "INSERT OR REPLACE INTO kv_store(key, value) VALUES(?,?)",
             (key, value)
         )
-        commit()
 
     # ───────────────────────── bulk movie id helpers ─────────────────────
     @staticmethod
-    def movie_ids_sorted(resume_after: int | None = None) -> list[int]:
-        if resume_after:
-            rows = execute(
-                "SELECT id FROM movies WHERE id>? ORDER BY id",
-                (resume_after,)
-            ).fetchall()
-        else:
-            rows = execute("SELECT id FROM movies ORDER BY id").fetchall()
-        return [r["id"] for r in rows]
+    def movies_sorted(resume_after: int | None = None) -> Iterator[tuple[int, str]]:
+        """Yield (id, title) in id order, row by row from one cursor."""
+        cur = execute(
+            "SELECT id, title FROM movies WHERE id>? ORDER BY id",
+            (resume_after or 0,)
+        )
+        for r in cur:
+            yield r["id"], r["title"]
 
     @staticmethod
     def movies_missing_trailer(resume_after: int | None = None):
@@ -369,6 +419,7 @@ class MovieRepo:
         return int(row["value"]) if row else None
 
     @staticmethod
+    @_writes
     def trend_cache_set(term: str, score: int) -> None:
         """
         Store today's trend *score* (0-100) for *term*.
@@ -377,9 +428,9 @@ class MovieRepo:
             "INSERT OR REPLACE INTO trend_cache(term, as_of, value) VALUES (?,?,?)",
             (term, date.today(), str(score))
         )
-        commit()
         
     @staticmethod
+    @_writes
     def link_movies_to_spreadsheet_theme(movie_ids: list[int], theme_id: int) -> None:
         """
         Insert (movie_id, theme_id) rows into movie_spreadsheet_themes, ignoring duplicates.
@@ -392,7 +443,6 @@ class MovieRepo:
             "(movie_id, spreadsheet_theme_id) VALUES (?,?)",
             params,
         )
-        commit()
     
     
     @staticmethod    
@@ -411,6 +461,7 @@ class MovieRepo:
         return row["id"] if row else None
     
     @staticmethod
+    @_writes
     def update_movie_tmdb_id(movie_id: int, tmdb_id: int) -> None:
         """
         Persist TMDb’s numeric id into movies.tmdb_id.
@@ -423,7 +474,6 @@ class MovieRepo:
             """,
             (tmdb_id, movie_id))
             
-        commit()
         
     @staticmethod
     def list_origins() -> list[str]:
@@ -440,16 +490,17 @@ class MovieRepo:
         rows = execute("SELECT name FROM themes ORDER BY name").fetchall()
         return [r["name"] for r in rows]
     
-
+    @staticmethod
+    @_writes
     def _ensure_franchise(name: str) -> int:
         row = execute("SELECT id FROM franchises WHERE name=?", (name,)).fetchone()
         if row:
             return row["id"]
         cur = execute("INSERT INTO franchises(name) VALUES(?)", (name,))
-        commit()
         return cur.lastrowid
     
     @staticmethod
+    @_writes
     def update_movie_franchise(movie_id: int, franchise: str) -> None:
         """
         Persist a franchise / universe label into movies.franchise.
@@ -457,8 +508,9 @@ class MovieRepo:
         """
         fid = MovieRepo._ensure_franchise(franchise)
         execute("UPDATE movies SET franchise_id=? WHERE id=?", (fid, movie_id))
-        commit()
-        
+
+    @staticmethod
+    @_writes
     def _ensure_country(name_or_iso: str) -> str:
         """
         Return an ISO-2 country code, inserting into `countries`
@@ -473,7 +525,6 @@ class MovieRepo:
             raise ValueError(f"Unrecognised country: {name_or_iso}")
         execute("INSERT OR IGNORE INTO countries(iso2, name) VALUES (?,?)",
                 (code, name_or_iso))
-        commit()
         return code
 
         
@@ -1,9 +1,10 @@
 # movie_night_db.py
 from __future__ import annotations
+from contextlib import contextmanager
 from pathlib import Path
-import sqlite3, threading, atexit
+import queue, sqlite3, threading, atexit
 
-from movieNight.settings import DATABASE_PATH as _DB_PATH
+from movieNight.settings import DATABASE_PATH as _DB_PATH, MAX_CONCURRENT_JOBS
 
 # ─── internal state ─────────────────────────────────────────────────────
 _thread_local = threading.local()   # holds .conn per thread
@@ -12,6 +13,7 @@ _write_lock   = threading.RLock()   # for SERIALISE_WRITES
 _SCHEMA_DONE  = False               # process-wide flag
 
 SERIALISE_WRITES = False            # flip True if you see “database is locked”
+POOL_SIZE        = MAX_CONCURRENT_JOBS + 1       # one reader per job + the worker's own
 
 _SCHEMA_PATH = Path(__file__).with_name("movie_night_schema.sql")
 
@@ -36,18 +38,128 @@ def _new_connection() -> sqlite3.Connection:
 
     return conn
 
+def _pooled_connection(read_only: bool) -> sqlite3.Connection:
+    """Open a connection for `ConnectionPool` (shared across threads, WAL)."""
+    conn = sqlite3.connect(
+        _DB_PATH,
+        check_same_thread=False,    # handed between threads by the pool
+        isolation_level="DEFERRED",
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    if read_only:
+        conn.execute("PRAGMA query_only=1")
+    return conn
+
+def _is_write(sql: str) -> bool:
+    return sql.lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE", "REPLACE"))
+
 # bootstrap the “main” connection now
 _root_conn = _new_connection()
 
+# ─── connection pool ─────────────────────────────────────────────────────
+class ConnectionPool:
+    """
+    Up to *size* read-only connections, reused LIFO, plus one writer
+    connection guarded by a lock. SQLite only allows one writer at a time
+    anyway.
+
+    A checked-out connection is bound to the calling thread, so the
+    module-level `execute` / `executemany` helpers (and therefore every
+    MovieRepo look-up) use it without change. Readers are query-only;
+    MovieRepo's writers always run inside `writer()`.
+    """
+
+    def __init__(self, size: int = POOL_SIZE):
+        self._size        = size
+        self._opened      = 0
+        self._readers     = queue.LifoQueue()
+        self._open_lock   = threading.Lock()
+        self._writer: sqlite3.Connection | None = None
+        self._writer_lock = threading.RLock()
+
+    def _checkout(self) -> sqlite3.Connection:
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        with self._open_lock:
+            if self._opened < self._size:
+                self._opened += 1
+                return _pooled_connection(read_only=True)
+        return self._readers.get()          # all busy → wait for a return
+
+    @contextmanager
+    def reader(self):
+        """Bind a pooled read connection to this thread (re-entrant)."""
+        bound = getattr(_thread_local, "pooled", None)
+        if bound is not None:
+            yield bound
+            return
+        conn = self._checkout()
+        _thread_local.pooled = conn
+        try:
+            yield conn
+        finally:
+            _thread_local.pooled = None
+            self._readers.put(conn)
+
+    @contextmanager
+    def writer(self):
+        """
+        Hold the writer connection for the block; commit on success,
+        roll back on error (outermost block only).
+        """
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = _pooled_connection(read_only=False)
+            outer = getattr(_thread_local, "writing", None) is None
+            _thread_local.writing = self._writer
+            try:
+                yield self._writer
+                if outer:
+                    self._writer.commit()
+            except BaseException:
+                if outer:
+                    self._writer.rollback()
+                raise
+            finally:
+                if outer:
+                    _thread_local.writing = None
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        if self._writer is not None:
+            self._writer.close()
+
+POOL = ConnectionPool()
+
 # ─── public helpers ──────────────────────────────────────────────────────
 def connection() -> sqlite3.Connection:
     """
     Return this thread’s sqlite3.Connection, creating it on first use.
     Main (importing) thread gets `_root_conn`; workers call `attach_thread()`
-    to get their own.
+    to get their own, or check one out of `POOL`. An active `POOL.writer()`
+    block wins over a pooled reader, which wins over the thread's own.
     """
-    conn = getattr(_thread_local, "conn", None)
-    return conn if conn is not None else _root_conn
+    for attr in ("writing", "pooled", "conn"):
+        conn = getattr(_thread_local, attr, None)
+        if conn is not None:
+            return conn
+    return _root_conn
+
+def read_conn():
+    """`with read_conn():` – borrow a pooled read connection for this thread."""
+    return POOL.reader()
+
+def write_conn():
+    """`with write_conn():` – hold the single writer; commits on exit."""
+    return POOL.writer()
 
 def attach_thread() -> None:
     """
@@ -64,9 +176,7 @@ def execute(sql: str, params: tuple = ()) -> sqlite3.Cursor:
     """
     conn = connection()
     cur  = conn.cursor()
-    if SERIALISE_WRITES and sql.lstrip().upper().startswith(
-        ("INSERT", "UPDATE", "DELETE", "REPLACE")
-    ):
+    if SERIALISE_WRITES and _is_write(sql):
         with _write_lock:
             return cur.execute(sql, params)
     return cur.execute(sql, params)
@@ -78,9 +188,7 @@ def executemany(sql: str, seq: list[tuple]) -> sqlite3.Cursor:
     """
     conn = connection()
     cur  = conn.cursor()
-    if SERIALISE_WRITES and sql.lstrip().upper().startswith(
-        ("INSERT", "UPDATE", "DELETE", "REPLACE")
-    ):
+    if SERIALISE_WRITES and _is_write(sql):
         with _write_lock:
             cur.executemany(sql, seq)
     else:
@@ -88,7 +196,12 @@ def executemany(sql: str, seq: list[tuple]) -> sqlite3.Cursor:
     return cur
 
 def commit() -> None:
-    """Commit the current thread’s Connection."""
+    """
+    Commit the current thread’s Connection. Inside `write_conn()` this is a
+    no-op: the outermost block commits the whole transaction.
+    """
+    if getattr(_thread_local, "writing", None) is not None:
+        return
     connection().commit()
 
 # ─── cleanup ──────────────────────────────────────────────────────────────
@@ -99,6 +212,7 @@ def _close_everything() -> None:
     for conn in (getattr(_thread_local, "conn", None),):
         if isinstance(conn, sqlite3.Connection):
             conn.close()
+    POOL.close()
     # close root
     if isinstance(_root_conn, sqlite3.Connection):
         _root_conn.close()
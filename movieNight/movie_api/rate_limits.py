@@ -0,0 +1,57 @@
+# movieNight/movie_api/rate_limits.py
+"""
+Process-wide request budgets shared by every client and worker thread.
+
+    with TMDB_LIMITER:
+        resp = session.get(...)
+
+Each limiter is a token bucket: short bursts up to *rate* go straight
+through, sustained traffic is held to *rate* per *per* seconds across all
+threads – unlike a per-call `min_delay`, which serialises everything and
+knows nothing about other callers. Responses served from the HTTP cache
+hand their token back with `refund()`.
+"""
+from __future__ import annotations
+
+import threading, time
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing *rate* acquisitions per *per* seconds."""
+
+    def __init__(self, rate: float, per: float):
+        self.capacity  = float(rate)
+        self.fill_rate = rate / per            # tokens per second
+        self._tokens   = float(rate)
+        self._stamp    = time.monotonic()
+        self._lock     = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until one token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.fill_rate)
+                self._stamp  = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.fill_rate
+            time.sleep(wait)
+
+    def refund(self) -> None:
+        """Give back one token, e.g. when the request was a cache hit."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + 1)
+
+    def __enter__(self) -> "TokenBucket":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+TMDB_LIMITER = TokenBucket(40, 10)   # TMDb: ~40 requests / 10 s per IP
+IMDB_LIMITER = TokenBucket(1, 1)     # IMDb scraping: stay polite, 1 page / s
+YOUTUBE_LIMITER = TokenBucket(5, 2)  # YouTube trailer search: 2.5 req / s, as the old 0.4 s throttle
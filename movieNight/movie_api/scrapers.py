@@ -1,10 +1,12 @@
 # movieNight/movie_api/scrappers.py
 from __future__ import annotations
 
-import json, re, time, random, requests
+import json, re, requests
 from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
 
-from movieNight.utils import log_debug   # your existing logger
+from movieNight.utils import http_session, log_debug   # your existing logger
+from movieNight.movie_api.rate_limits import IMDB_LIMITER, TokenBucket
 
 # ---------- Regex patterns--------------------------------------
 _HISTOGRAM_RE   = re.compile(rb'"rating_histogram":\s*(\[[^\]]+\])', re.DOTALL)
@@ -19,16 +21,18 @@ class IMDbScraper:
 
     Parameters
     ----------
-    min_delay : float
-        Minimum seconds between successive network requests
-        (default 1.0).  A ±0.3 s jitter is added to avoid looking like
-        a fixed-interval bot.
+    limiter : TokenBucket
+        Request budget shared with every other scraper instance
+        (default `IMDB_LIMITER`, 1 page / s process-wide).
     """
 
     RATING_URL = "https://www.imdb.com/title/{imdb_id}/ratings"
 
-    def __init__(self, *, min_delay: float = 1.0, session: Optional[requests.Session] = None):
-        self.session = session or requests.Session()
+    def __init__(self, *, limiter: TokenBucket = IMDB_LIMITER, session: Optional[requests.Session] = None):
+        if session is None:
+            session = http_session()
+            session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+        self.session = session
         self.session.headers.update(
             {
                 "User-Agent":
@@ -36,23 +40,28 @@ class IMDbScraper:
                 "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
             }
         )
-        self._min_delay = min_delay
-        self._last_hit  = 0.0   # epoch timestamp of previous fetch
+        self._limiter = limiter
 
     # ------------------------------------------------------------------ public
     def fetch_all(self, imdb_id: str) -> Optional[Dict[str, Any]]:
         """Return histogram, demographic splits, ranks – or None if parse fails."""
         html = self._get_raw(imdb_id)
-        if not html:
-            return None
+        return self.parse(html) if html else None
 
-        hist = self._parse_histogram(html)
+    @staticmethod
+    def parse(html: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Pure parse of a ratings page (no I/O, no instance state). Kept
+        separate from the fetch so it can be handed to an executor,
+        e.g. ``pool.submit(IMDbScraper.parse, html)``.
+        """
+        hist = IMDbScraper._parse_histogram(html)
         if hist is None:
             return None
 
-        demo = self._parse_demographic(html)
-        rank = self._extract_int(_TOP250_RE, html)
-        heat = self._extract_int(_MOVIEMETER_RE, html)
+        demo = IMDbScraper._parse_demographic(html)
+        rank = IMDbScraper._extract_int(_TOP250_RE, html)
+        heat = IMDbScraper._extract_int(_MOVIEMETER_RE, html)
 
         return {
             "histogram":    hist,
@@ -63,14 +72,11 @@ class IMDbScraper:
 
     # --------------------------------------------------------- network & delay
     def _get_raw(self, imdb_id: str) -> Optional[bytes]:
-        # ---- throttle --------------------------------------------------
-        wait = self._min_delay - (time.time() - self._last_hit)
-        if wait > 0:
-            time.sleep(wait + random.uniform(0.0, 0.3))
-        # ---------------------------------------------------------------
         try:
-            resp = self.session.get(self.RATING_URL.format(imdb_id=imdb_id), timeout=8)
-            self._last_hit = time.time()
+            with self._limiter:
+                resp = self.session.get(self.RATING_URL.format(imdb_id=imdb_id), timeout=8)
+            if getattr(resp, "from_cache", False):      # never hit IMDb
+                self._limiter.refund()
             if resp.status_code == 200:
                 return resp.content
             log_debug(f"IMDb HTTP {resp.status_code} for {imdb_id}")
@@ -79,7 +85,8 @@ class IMDbScraper:
         return None
 
     # ----------------------------------------------------------- parsing bits
-    def _parse_histogram(self, html: bytes) -> Optional[Dict[int, int]]:
+    @staticmethod
+    def _parse_histogram(html: bytes) -> Optional[Dict[int, int]]:
         m = _HISTOGRAM_RE.search(html)
         if not m:
             return None
@@ -90,7 +97,8 @@ class IMDbScraper:
             log_debug(f"IMDb histogram JSON error: {exc}")
             return None
 
-    def _parse_demographic(self, html: bytes) -> Dict[str, Dict[str, float]]:
+    @staticmethod
+    def _parse_demographic(html: bytes) -> Dict[str, Dict[str, float]]:
         m = _DEMOGRAPHIC_RE.search(html)
         if not m:
             return {}
@@ -10,6 +10,13 @@ from movieNight.utils import log_debug
 load_dotenv(GOOGLE_SERVICE_ACCOUNT_FILE.parent / "secret.env")
 import openpyxl
 
+try:  # optional Rust-backed reader; openpyxl is the fallback
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+_WORKBOOK: tuple[tuple[str, float], object] | None = None   # ((path, mtime), workbook)
+
 def get_drive_service():
     """Authenticate & return a Google Drive service client."""
     creds = Credentials.from_service_account_file(
@@ -60,6 +67,38 @@ def get_non_green_tabs(spreadsheet_id: str) -> list[str]:
                              and color.get("blue", 0) < 0.2):
             result.append(title)
     return result
+
+
+def close_workbook() -> None:
+    """
+    Close the cached workbook, if any. Call before overwriting the .xlsx:
+    read-only openpyxl keeps the zip open, which blocks the write on Windows.
+    """
+    global _WORKBOOK
+    if _WORKBOOK is None:
+        return
+    workbook, _WORKBOOK = _WORKBOOK[1], None
+    if hasattr(workbook, "close"):
+        workbook.close()
+
+
+def _load_workbook(excel_path: str, mtime: float):
+    """
+    Open the workbook once per file version; when the file changes the
+    previous workbook is closed first.
+    """
+    global _WORKBOOK
+    if _WORKBOOK is not None and _WORKBOOK[0] == (excel_path, mtime):
+        return _WORKBOOK[1]
+    close_workbook()
+    if CalamineWorkbook is not None:
+        workbook = CalamineWorkbook.from_path(excel_path)
+    else:
+        workbook = openpyxl.load_workbook(excel_path, read_only=True)
+    _WORKBOOK = ((excel_path, mtime), workbook)
+    return workbook
+
+
 def get_movie_titles_from_sheet(
     excel_path: Path,
     sheet_name: str
@@ -70,18 +109,27 @@ def get_movie_titles_from_sheet(
     Logs an error and returns [] if the sheet is missing.
     """
     try:
-        workbook = openpyxl.load_workbook(excel_path, read_only=True)
+        workbook = _load_workbook(str(excel_path), excel_path.stat().st_mtime)
+        sheet_names = (workbook.sheet_names if CalamineWorkbook is not None
+                       else workbook.sheetnames)
     except Exception as e:
         log_debug(f"[ERROR] Failed to load workbook {excel_path}: {e}")
         return []
 
-    if sheet_name not in workbook.sheetnames:
+    if sheet_name not in sheet_names:
         log_debug(f"[ERROR] Sheet '{sheet_name}' not found in {excel_path.name}.")
         return []
 
-    sheet = workbook[sheet_name]
+    if CalamineWorkbook is not None:
+        rows = workbook.get_sheet_by_name(sheet_name).to_python()
+    else:
+        rows = workbook[sheet_name].iter_rows(min_row=1, max_col=1, values_only=True)
+
     titles: list[str] = []
-    for (cell_value,) in sheet.iter_rows(min_row=1, max_col=1, values_only=True):
+    for row in rows:
+        cell_value = row[0] if row else None
+        if isinstance(cell_value, float) and cell_value.is_integer():
+            cell_value = int(cell_value)   # calamine yields numeric cells as float
         if cell_value and str(cell_value).strip():
             titles.append(str(cell_value).strip())
 
@@ -32,8 +32,13 @@ LOG_PATH            = BASE_DIR / "trailer_debug.log"
 AUTO_UPDATE_SCRIPT  = BASE_DIR / "autoUpdate.py"
 GOOGLE_SERVICE_ACCOUNT_FILE = BASE_DIR / "service_secret.json"
 DATABASE_PATH       = BASE_DIR / "movie_night.sqlite"
+HTTP_CACHE_PATH     = BASE_DIR / "http_cache.sqlite"   # TMDb / OMDb / IMDb responses
+COUNTRIES_CACHE_PATH = BASE_DIR / ".cache" / "tmdb_countries.json"
 GRADED_MOVIES       = "seen"
 
+# Background workers
+MAX_CONCURRENT_JOBS = 4     # movies in flight at once (all network-bound)
+
 
 # API scopes and URLs
 DRIVE_SCOPES       = ["https://www.googleapis.com/auth/drive.readonly"]
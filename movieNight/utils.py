@@ -8,15 +8,23 @@ from datetime import datetime
 import subprocess
 from sys import platform
 import tempfile
+import threading
 import time
 from typing import Optional, List, Tuple
 import webbrowser
 
+import requests
+
 from PySide6.QtCore    import Qt # type: ignore
 from PySide6.QtGui     import QPixmap, QPainter, QFont, QColor, QPalette # type: ignore
 from PySide6.QtWidgets import QApplication # type: ignore
 
-from movieNight.settings import LOG_PATH, ACCENT_COLOR
+from movieNight.settings import LOG_PATH, ACCENT_COLOR, HTTP_CACHE_PATH
+
+try:  # optional: on-disk HTTP response cache, plain Session otherwise
+    import requests_cache
+except ImportError:
+    requests_cache = None
 
 
 def log_debug(message: str) -> None:
@@ -131,22 +139,45 @@ def open_url_host_browser(url: str) -> None:
 
 def throttle(min_delay: float = 1.0):
     """
-    Decorator that sleeps `min_delay ±0.3 s` between *network* calls on the
-    same function – thread-safe for a single GUI thread.
+    Decorator that spaces *network* calls on the same function at least
+    `min_delay` (+0–0.3 s jitter) apart. Thread-safe: each caller reserves
+    its slot under a lock, so pool threads queue up instead of racing.
     """
     def wrap(fn):
         last_hit = 0.0
+        lock = threading.Lock()
         @functools.wraps(fn)
         def inner(*a, **kw):
             nonlocal last_hit
-            wait = min_delay - (time.time() - last_hit)
-            if wait > 0:
-                time.sleep(wait + random.uniform(0, 0.3))
-            out = fn(*a, **kw)
-            last_hit = time.time()
-            return out
+            with lock:
+                now  = time.time()
+                wait = min_delay - (now - last_hit)
+                wait = wait + random.uniform(0, 0.3) if wait > 0 else 0.0
+                last_hit = now + wait
+            if wait:
+                time.sleep(wait)
+            return fn(*a, **kw)
         return inner
     return wrap
+
+def http_session(expire_after: int = 86400, urls_expire_after: dict | None = None) -> requests.Session:
+    """
+    Session for the TMDb / OMDb / IMDb clients. With *requests-cache*
+    installed, successful GETs are kept in HTTP_CACHE_PATH (SQLite) for
+    *expire_after* seconds, so repeat runs are served from disk. API keys
+    are left out of the cache key and the stored request.
+    *urls_expire_after* overrides the TTL per URL pattern.
+    """
+    if requests_cache is None:
+        return requests.Session()
+    return requests_cache.CachedSession(
+        str(HTTP_CACHE_PATH),
+        backend="sqlite",
+        expire_after=expire_after,
+        urls_expire_after=urls_expire_after or {},
+        allowable_methods=("GET",),
+        ignored_parameters=["api_key", "apikey"],
+    )
        
 def score_to_grade(score: float) -> str:
     bands = [
@@ -165,20 +196,49 @@ def _valid(url: str | None) -> bool:
 def _make_url(video_id: str) -> str:
     return f"https://www.youtube.com/watch?v={video_id}"
 
+# per-run memo: casefolded title → locate_trailer result (misses included),
+# so a title repeated across tabs / workers is searched only once
+_TRAILER_MEMO: dict[str, Tuple[str | None, str, float]] = {}
+_TRAILER_MEMO_MAX  = 4096
+_TRAILER_MEMO_LOCK = threading.Lock()
+
+def clear_trailer_memo() -> None:
+    """Forget memoized lookups (e.g. after a run wrote new trailer links)."""
+    with _TRAILER_MEMO_LOCK:
+        _TRAILER_MEMO.clear()
+
 
 # --- public API --------------------------------------------------------------
-@throttle(min_delay=0.4)            # ⇠ stay well under 40 req / 10 s (TMDb)
-def locate_trailer( title: str) -> Tuple[str | None, str, float]:
+def locate_trailer(title: str) -> Tuple[str | None, str, float]:
     """
     Find a trailer URL for *title*.
 
     *sheet* is accepted for backward-compatibility but ignored; DB now
     stores only one `youtube_link` per movie.
 
+    Results (misses included) are memoized per casefolded title until
+    `clear_trailer_memo()`.
+
     Returns (url | None, source, confidence)
     """
+    key = title.strip().casefold()
+    hit = _TRAILER_MEMO.get(key)
+    if hit is not None:
+        return hit
+
+    result = _locate_trailer(title)
+    with _TRAILER_MEMO_LOCK:
+        if len(_TRAILER_MEMO) >= _TRAILER_MEMO_MAX:
+            _TRAILER_MEMO.pop(next(iter(_TRAILER_MEMO)))     # drop the oldest
+        _TRAILER_MEMO[key] = result
+    return result
+
+# TMDb calls are metered by TMDB_LIMITER inside TMDBClient._get,
+# the YouTube fallbacks by YOUTUBE_LIMITER below
+def _locate_trailer(title: str) -> Tuple[str | None, str, float]:
     from movieNight.metadata.api_clients import tmdb_client, yt_client
     from movieNight.metadata.core import repo
+    from movieNight.movie_api.rate_limits import YOUTUBE_LIMITER
     # 0. DB cache -------------------------------------------------------------
     mid = repo.get_movie_id_by_title(title)
     if mid:
@@ -193,12 +253,14 @@ def locate_trailer( title: str) -> Tuple[str | None, str, float]:
 
     # 2. yt-dl on TMDb slug ---------------------------------------------------
     if best := tmdb_client.try_slug_search(title):
-        vid = yt_client.search_first_match(best + " trailer", exact=True)
+        with YOUTUBE_LIMITER:
+            vid = yt_client.search_first_match(best + " trailer", exact=True)
         if vid:
             return _make_url(vid), "yt_dl", 0.80
 
     # 3. raw YouTube search ---------------------------------------------------
-    vid = yt_client.search_first_match(title + " trailer", exact=False, max_retries=3)
+    with YOUTUBE_LIMITER:
+        vid = yt_client.search_first_match(title + " trailer", exact=False, max_retries=3)
     if vid:
         return _make_url(vid), "youtube", 0.60
 